@@ -17,8 +17,6 @@ import pandas as pd
 from dashboard.utils.data import (
     load_enriched_season_stats,
     get_coverage_from_appearances,
-    get_available_comp_seasons,
-    load_players_index,
 )
 from dashboard.utils.constants import COMP_NAMES, COMP_FLAGS, POSITION_NAMES
 from dashboard.utils.sidebar import render_sidebar
@@ -52,20 +50,43 @@ st.markdown(
 # ---------------------------------------------------------------------------
 # Load data
 # ---------------------------------------------------------------------------
-with st.spinner("Loading dataset…"):
+@st.cache_data(show_spinner=False, ttl=3600)
+def _home_summary() -> dict:
+    """KPI counts and players per position from the season stats.
+
+    Only these small values come out of the cache on a rerun. The full season-stats
+    frame is not copied out of the loader cache on every click.
+    """
     df = load_enriched_season_stats()
+    # factorize skips NaN like nunique() but avoids its generic per-dtype dispatch
+    return {
+        "n_players": pd.factorize(df["player_id"])[1].size,
+        "n_seasons": pd.factorize(df["season"])[1].size,
+        "n_leagues": pd.factorize(df["competition_slug"])[1].size,
+        "n_appearances": int(df["appearances"].sum()),
+        "n_goals": int(df["goals"].sum()),
+        "pos_counts": (
+            df.groupby("player_position")["player_id"]
+            .nunique()
+            .reindex(["F", "M", "D", "G"])
+            .dropna()
+            .astype(int)
+        ),
+    }
+
+
+with st.spinner("Loading dataset…"):
+    summary = _home_summary()
     cov = get_coverage_from_appearances()
-    avail = get_available_comp_seasons()
-    players_idx = load_players_index()
 
 # ---------------------------------------------------------------------------
 # Top-level KPIs
 # ---------------------------------------------------------------------------
-n_players     = df["player_id"].nunique()
-n_seasons     = df["season"].nunique()
-n_leagues     = df["competition_slug"].nunique()
-n_appearances = int(df["appearances"].sum())
-n_goals       = int(df["goals"].sum())
+n_players     = summary["n_players"]
+n_seasons     = summary["n_seasons"]
+n_leagues     = summary["n_leagues"]
+n_appearances = summary["n_appearances"]
+n_goals       = summary["n_goals"]
 
 c1, c2, c3, c4, c5 = st.columns(5)
 c1.metric("Players",      f"{n_players:,}")
@@ -141,12 +162,7 @@ with right:
     st.markdown("<div class='section-header'>📊 Position Breakdown</div>", unsafe_allow_html=True)
     st.caption("Players by primary position.")
 
-    pos_counts = (
-        df.groupby("player_position")["player_id"]
-        .nunique()
-        .reindex(["F", "M", "D", "G"])
-        .dropna()
-    )
+    pos_counts = summary["pos_counts"]
     for pos, cnt in pos_counts.items():
         label = POSITION_NAMES.get(pos, pos)
         st.markdown(
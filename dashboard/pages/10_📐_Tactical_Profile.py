@@ -10,6 +10,7 @@ Deep team analysis with:
 
 import sys
 import pathlib
+from operator import itemgetter
 
 _project_root = pathlib.Path(__file__).resolve().parent.parent.parent
 if str(_project_root) not in sys.path:
@@ -295,15 +296,20 @@ def _team_wdl_all_comps(team_name: str, season: str, comps_list: list) -> dict:
     return out
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
 def _team_last_matches_all_comps(team_name: str, season: str, comps_list: list, n: int = 5) -> pd.DataFrame:
-    """Last N matches across competitions, sorted by date (most recent first)."""
+    """Last N matches across competitions, sorted by date (most recent first).
+
+    Cached so the match mask is built once per team/season/comps, not on every rerun.
+    """
     ms = load_match_summary()
     mask = (
         ((ms["home_team_name"] == team_name) | (ms["away_team_name"] == team_name)) &
         (ms["season"] == season) &
         (ms["competition_slug"].isin(comps_list))
     )
-    team_matches = ms[mask].copy()
+    # Read-only slice: sort_values below returns a new frame, so no .copy() needed
+    team_matches = ms.loc[mask]
     if team_matches.empty or "match_date_utc" not in team_matches.columns:
         return pd.DataFrame()
     team_matches = team_matches.sort_values("match_date_utc", ascending=False)
@@ -352,6 +358,7 @@ def _team_home_away_summary_all_comps(team_name: str, season: str, comps_list: l
     return {"home": home_agg, "away": away_agg}
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
 def _team_home_away_summary(team_name: str, season: str, competition_slug: str) -> dict:
     """Home and away W-D-L, goals, xG for team in season/competition. Keys: 'home', 'away'."""
     ms = load_match_summary()
@@ -360,7 +367,7 @@ def _team_home_away_summary(team_name: str, season: str, competition_slug: str)
         & (ms["season"] == season)
         & (ms["competition_slug"] == competition_slug)
     )
-    team_matches = ms[mask].copy()
+    team_matches = ms.loc[mask]
     empty = {"W": 0, "D": 0, "L": 0, "matches": 0, "goals_for": 0, "goals_against": 0, "xg_for": 0.0, "xg_against": 0.0}
 
     def side_stats(subset: pd.DataFrame, is_home: bool) -> dict:
@@ -646,7 +653,7 @@ if _hm_path.exists() and not _ms.empty and team_name and season:
         _label = f"{_date_str} {_home} – {_away} ({_ha})"
         _side = "home" if _is_home else "away"
         _single_raw.append((_sort_ts, _mid, _label, _side))
-    _single_raw.sort(key=lambda x: x[0], reverse=True)  # newest first
+    _single_raw.sort(key=itemgetter(0), reverse=True)  # newest first
     _match_options_for_single = [(m, lb, s) for _, m, lb, s in _single_raw]
 # Season average: use ALL comps this team plays this season (from match summary), not the user's competition filter
 # Normalize season to str so session state (e.g. from Directory) never causes a type mismatch in the filter
@@ -66,6 +66,7 @@ except ImportError:
             except Exception:
                 return pd.DataFrame()
 
+    @st.cache_data(show_spinner=False, ttl=3600)
     def get_head_to_head(
         team_a: str,
         team_b: str,
@@ -163,7 +164,85 @@ def _suggest_non_negotiables(
     return out[:3]
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
+def _team_deep_link_index() -> tuple:
+    """Return (lowercased name -> team_name, team_name -> row positions) for team_stats.
+
+    Lets ?your=&opp= deep links resolve names and rows by dict lookup instead of
+    scanning load_team_season_stats() once per parameter.
+    """
+    ts = load_team_season_stats()
+    if ts.empty:
+        return {}, {}
+    by_lower = {}
+    for t in ts["team_name"].dropna().unique():
+        by_lower.setdefault(str(t).strip().lower(), t)
+    return by_lower, ts.groupby("team_name", sort=False).indices
+
+
+def _html_text(s) -> str:
+    """Escape &, < and > for the gaffer sheet."""
+    if not s:
+        return ""
+    return str(s).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _build_prep_report_markdown(report: dict) -> str:
+    """Build the match-day Markdown report.
+
+    Args:
+        report: Report inputs (fixture, formations, non-negotiables, scouting lists)
+
+    Returns:
+        Markdown string for the download button
+    """
+    lines = [
+        f"# Opponent Prep: {report['home']} vs {report['away']} ({report['venue']})",
+        f"\n**Season:** {report['season']} · **Competition:** {report['competition']} · **Venue:** {report['venue']}\n",
+        "## Tactical brief (match-day)",
+        f"- **Formations:** Our team {report['our_formation']} · Opponent {report['opp_formation']}",
+        "- **Three non-negotiables:**",
+    ]
+    append = lines.append
+    for i, n in enumerate(report["non_negotiables"][:3], start=1):
+        append(f"  {i}. {n or '(not set)'}")
+    append("- **Staff talking points:**")
+    lines.extend("  - " + t for t in report["talking_points"])
+    append("")
+    append("## Formations")
+    append(f"- **Our team:** {report['our_formation']}")
+    append(f"- **Opponent:** {report['opp_formation']}")
+    append("")
+    append("## Tactical summary")
+    append(report["predicted"])
+    append("## Threats")
+    lines.extend("- " + t for t in report["threats"])
+    append("## Weaknesses")
+    lines.extend("- " + w for w in report["weaknesses"])
+    append("## Key players to watch")
+    for p in report["key_players"]:
+        line = "- **" + p.get("name", "?") + "** (" + str(p.get("role", p.get("position", ""))) + ") – " + str(p.get("threat_level", ""))
+        if p.get("goals") is not None or p.get("assists") is not None:
+            line += f" · G:{p.get('goals', 0)} A:{p.get('assists', 0)} xG/90:{p.get('xg90', 0)}"
+        if p.get("strengths"):
+            strengths = p.get("strengths")
+            line += f"\n  - Strengths: {', '.join(strengths) if isinstance(strengths, list) else str(strengths)}"
+        if p.get("weaknesses"):
+            line += f"\n  - Weaknesses: {p.get('weaknesses', '')}"
+        if p.get("instruction"):
+            line += f"\n  - Instruction: {p.get('instruction', '')}"
+        append(line)
+    append("## Expected duels (by formation)")
+    duels = [
+        f"- **{r.get('Our slot', '')}** {r.get('Our player', '?')} ({r.get('Our pos', '')}) vs **{r.get('Their slot', '')}** {r.get('Their player', '?')} ({r.get('Their pos', '')})"
+        for r in report["matchup_rows"]
+    ]
+    lines.extend(duels or ["(Review Full prep tab for expected duels)"])
+    return "\n".join(lines)
+
+
 from dashboard.utils.constants import COMP_NAMES, COMP_FLAGS
+from dashboard.utils.filters import comp_label_map
 from dashboard.utils.scope import CURRENT_SEASON, DEFAULT_COMPETITION_SLUGS
 from dashboard.utils.sidebar import render_sidebar
 from dashboard.tactics.components.tactical_components import (
@@ -207,6 +286,13 @@ with st.spinner("Loading team data…"):
     tactical_df = load_tactical_profiles()
     player_df = load_enriched_season_stats()
 
+H2H_RESULT_COLORS = {"W": "#3FB950", "D": "#C9A840", "L": "#F85149"}
+NON_NEG_PLACEHOLDERS = (
+    "E.g. Press their back line on goal kicks",
+    "E.g. Track their 10 when we lose the ball",
+    "E.g. Win second balls in midfield",
+)
+
 # Default matchup: Westerlo (home/your) vs Union Saint-Gilloise (opponent) when nothing selected yet
 DEFAULT_HOME_TEAM = "Westerlo"
 DEFAULT_AWAY_TEAM = "Union Saint-Gilloise"
@@ -233,24 +319,27 @@ if st.session_state.your_team is None and st.session_state.opponent_team is None
 _your_param = st.query_params.get("your", "").strip()
 _opp_param = st.query_params.get("opp", "").strip()
 if _your_param and _opp_param and not team_stats.empty:
-    _teams = team_stats["team_name"].dropna().unique().tolist()
-    _match_your = next((t for t in _teams if str(t).strip().lower() == _your_param.lower()), None) or next(
-        (t for t in _teams if _your_param.lower() in str(t).lower()), None
-    )
-    _match_opp = next((t for t in _teams if str(t).strip().lower() == _opp_param.lower()), None) or next(
-        (t for t in _teams if _opp_param.lower() in str(t).lower()), None
-    )
+    _by_lower, _rows_by_team = _team_deep_link_index()
+
+    def _resolve_team(param: str):
+        p = param.lower()
+        return _by_lower.get(p) or next((t for low, t in _by_lower.items() if p in low), None)
+
+    def _season_row(rows: pd.DataFrame) -> pd.DataFrame:
+        current = rows[rows["season"] == CURRENT_SEASON]
+        return current if not current.empty else rows.iloc[:1]
+
+    _match_your = _resolve_team(_your_param)
+    _match_opp = _resolve_team(_opp_param)
     if _match_your and _match_opp:
-        _row_your = team_stats[(team_stats["team_name"] == _match_your) & (team_stats["season"] == CURRENT_SEASON)]
-        _row_opp = team_stats[(team_stats["team_name"] == _match_opp) & (team_stats["season"] == CURRENT_SEASON)]
-        if _row_your.empty:
-            _row_your = team_stats[team_stats["team_name"] == _match_your].iloc[:1]
-        if _row_opp.empty:
-            _row_opp = team_stats[team_stats["team_name"] == _match_opp].iloc[:1]
+        _all_your = team_stats.iloc[_rows_by_team[_match_your]]
+        _all_opp = team_stats.iloc[_rows_by_team[_match_opp]]
+        _row_your = _season_row(_all_your)
+        _row_opp = _season_row(_all_opp)
         if not _row_your.empty and not _row_opp.empty:
             r1, r2 = _row_your.iloc[0], _row_opp.iloc[0]
-            _comps_your = team_stats[(team_stats["team_name"] == _match_your) & (team_stats["season"] == r1["season"])]["competition_slug"].unique().tolist()
-            _comps_opp = team_stats[(team_stats["team_name"] == _match_opp) & (team_stats["season"] == r2["season"])]["competition_slug"].unique().tolist()
+            _comps_your = _all_your[_all_your["season"] == r1["season"]]["competition_slug"].unique().tolist()
+            _comps_opp = _all_opp[_all_opp["season"] == r2["season"]]["competition_slug"].unique().tolist()
             st.session_state.your_team = {"name": r1["team_name"], "season": r1["season"], "competition": r1["competition_slug"], "competitions": _comps_your}
             st.session_state.opponent_team = {"name": r2["team_name"], "season": r2["season"], "competition": r2["competition_slug"], "competitions": _comps_opp}
             st.rerun()
@@ -385,7 +474,7 @@ if st.session_state.your_team and st.session_state.opponent_team:
                 new_comp_your = st.selectbox(
                     "Your team context (competition):",
                     options=your["competitions"],
-                    format_func=lambda c: f"{COMP_FLAGS.get(c, '🏆')} {COMP_NAMES.get(c, c)}",
+                    format_func=comp_label_map(tuple(your["competitions"])).get,
                     index=idx_y,
                     key="your_comp_context",
                 )
@@ -400,7 +489,7 @@ if st.session_state.your_team and st.session_state.opponent_team:
                 new_comp = st.selectbox(
                     "Opponent context (competition):",
                     options=opp["competitions"],
-                    format_func=lambda c: f"{COMP_FLAGS.get(c, '🏆')} {COMP_NAMES.get(c, c)}",
+                    format_func=comp_label_map(tuple(opp["competitions"])).get,
                     index=idx,
                     key="opp_comp_context",
                 )
@@ -576,9 +665,9 @@ if st.session_state.your_team and st.session_state.opponent_team:
                 except Exception:
                     return "—"
             rows_html = []
-            for _, m in h2h.iterrows():
+            for m in h2h.to_dict("records"):
                 res = m.get("result", "?")
-                res_color = "#3FB950" if res == "W" else "#C9A840" if res == "D" else "#F85149"
+                res_color = H2H_RESULT_COLORS.get(res, "#F85149")
                 date_str = _mm_yy(m.get("date"))
                 score = m.get("score", "")
                 ha = m.get("home_away", "")
@@ -618,6 +707,7 @@ if st.session_state.your_team and st.session_state.opponent_team:
         ].sort_values("avg_rating", ascending=False)
 
         _opp_key = (opp.get("name") or "opp").replace(" ", "_")
+        _non_neg_keys = tuple(f"prep_non_neg_{i}_{_opp_key}" for i in (1, 2, 3))
         key_opp_players = []
         if not opp_players.empty:
             pos_to_role = {"G": "Goalkeeper", "D": "Defender", "M": "Midfielder", "F": "Forward"}
@@ -841,8 +931,7 @@ if st.session_state.your_team and st.session_state.opponent_team:
         st.session_state["prep_talking_points"] = talking_points[:10]
 
         # Non-negotiables (keyed by opponent)
-        for i in range(1, 4):
-            k = "prep_non_neg_" + str(i) + "_" + _opp_key
+        for k in _non_neg_keys:
             if k not in st.session_state:
                 st.session_state[k] = ""
 
@@ -1080,24 +1169,25 @@ if st.session_state.your_team and st.session_state.opponent_team:
             _kp_for_suggest = st.session_state.get("prep_key_players", [])
             if st.button("✨ Suggest 3", key="prep_suggest_3", help="Fill from threats, weaknesses and key player — edit as needed."):
                 _suggested = _suggest_non_negotiables(_threats_for_suggest, _weaknesses_for_suggest, _kp_for_suggest)
-                for i, _text in enumerate(_suggested[:3]):
-                    st.session_state["prep_non_neg_" + str(i + 1) + "_" + _opp_key] = _text
+                for k, _text in zip(_non_neg_keys, _suggested[:3]):
+                    st.session_state[k] = _text
                 st.rerun()
-            st.text_input("1", value=st.session_state.get("prep_non_neg_1_" + _opp_key, ""), placeholder="E.g. Press their back line on goal kicks", key="prep_non_neg_1_" + _opp_key, label_visibility="collapsed")
-            st.text_input("2", value=st.session_state.get("prep_non_neg_2_" + _opp_key, ""), placeholder="E.g. Track their 10 when we lose the ball", key="prep_non_neg_2_" + _opp_key, label_visibility="collapsed")
-            st.text_input("3", value=st.session_state.get("prep_non_neg_3_" + _opp_key, ""), placeholder="E.g. Win second balls in midfield", key="prep_non_neg_3_" + _opp_key, label_visibility="collapsed")
+            # One form so editing the three lines reruns the page once, on save, not per keystroke
+            with st.form("prep_non_neg_form"):
+                for i, (k, _placeholder) in enumerate(zip(_non_neg_keys, NON_NEG_PLACEHOLDERS), start=1):
+                    st.text_input(str(i), value=st.session_state.get(k, ""), placeholder=_placeholder, key=k, label_visibility="collapsed")
+                st.form_submit_button("Save non-negotiables")
             st.markdown("---")
             st.markdown("**Staff talking points**")
-            for pt in st.session_state.get("prep_talking_points", []):
-                st.markdown(f"- {pt}")
+            _tp_brief = st.session_state.get("prep_talking_points", [])
+            if _tp_brief:
+                st.markdown("\n".join(f"- {pt}" for pt in _tp_brief))
             if not _report_md:
                 st.caption("Generate the full report by viewing the Full prep tab once, then return here to download.")
 
         with tab_gaffer:
             # One-page gaffer sheet: same data as Match-day brief, layout optimized for A4 print.
-            _n1 = st.session_state.get("prep_non_neg_1_" + _opp_key, "")
-            _n2 = st.session_state.get("prep_non_neg_2_" + _opp_key, "")
-            _n3 = st.session_state.get("prep_non_neg_3_" + _opp_key, "")
+            _n1, _n2, _n3 = (st.session_state.get(k, "") for k in _non_neg_keys)
             _tp = st.session_state.get("prep_talking_points", [])[:7]
             _threats = st.session_state.get("prep_threats", [])
             _weaknesses = st.session_state.get("prep_weaknesses", [])
@@ -1107,11 +1197,7 @@ if st.session_state.your_team and st.session_state.opponent_team:
             _opp_f = st.session_state.get("prep_opp_formation", "4-3-3")
             _comp_label = f"{COMP_FLAGS.get(opp.get('competition', ''), '')} {COMP_NAMES.get(opp.get('competition', ''), opp.get('competition', ''))}"
 
-            def _h(s: str) -> str:
-                if not s:
-                    return ""
-                return str(s).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-
+            _h = _html_text
             _title = _h(f"{_fixture_home} vs {_fixture_away}")
             _venue = _h(_venue_label)
             _gaffer_html = f"""<!DOCTYPE html>
@@ -1182,10 +1268,11 @@ h1 {{ font-size: 14pt; margin: 0 0 6px 0; border-bottom: 2px solid #333; padding
 <h2>Key players</h2>
 <ul>
 """
-            for p in _kp:
-                name = _h(p.get("name", "?"))
-                role = _h(p.get("role", p.get("position", "")))
-                inst = _h((p.get("instruction") or "").strip())
+            _kp_safe = [
+                (_h(p.get("name", "?")), _h(p.get("role", p.get("position", ""))), _h((p.get("instruction") or "").strip()))
+                for p in _kp
+            ]
+            for name, role, inst in _kp_safe:
                 _gaffer_html += f"<li><strong>{name}</strong> ({role})" + (f" — {inst}" if inst else "") + "</li>\n"
             _gaffer_html += """</ul>
 </div>
@@ -1195,8 +1282,12 @@ h1 {{ font-size: 14pt; margin: 0 0 6px 0; border-bottom: 2px solid #333; padding
 <h2>Duels</h2>
 <table class="duels"><thead><tr><th>Us</th><th>Player</th><th></th><th>Player</th><th>Them</th></tr></thead><tbody>
 """
-                for r in _duels:
-                    _gaffer_html += f"<tr><td>{_h(r.get('Our slot', ''))}</td><td>{_h(r.get('Our player', ''))}</td><td>vs</td><td>{_h(r.get('Their player', ''))}</td><td>{_h(r.get('Their slot', ''))}</td></tr>\n"
+                _duels_safe = [
+                    (_h(r.get("Our slot", "")), _h(r.get("Our player", "")), _h(r.get("Their player", "")), _h(r.get("Their slot", "")))
+                    for r in _duels
+                ]
+                for our_slot, our_player, their_player, their_slot in _duels_safe:
+                    _gaffer_html += f"<tr><td>{our_slot}</td><td>{our_player}</td><td>vs</td><td>{their_player}</td><td>{their_slot}</td></tr>\n"
                 _gaffer_html += "</tbody></table>\n</div>\n"
             _gaffer_html += "</div>\n</body>\n</html>"
 
@@ -1220,45 +1311,25 @@ h1 {{ font-size: 14pt; margin: 0 0 6px 0; border-bottom: 2px solid #333; padding
                 st.markdown("**Key players:** " + ", ".join(p.get("name", "?") for p in _kp))
 
         # Build report and store for Match-day brief download and bottom section
-        _n1 = st.session_state.get("prep_non_neg_1_" + _opp_key, "")
-        _n2 = st.session_state.get("prep_non_neg_2_" + _opp_key, "")
-        _n3 = st.session_state.get("prep_non_neg_3_" + _opp_key, "")
+        _n1, _n2, _n3 = (st.session_state.get(k, "") for k in _non_neg_keys)
         _tp = st.session_state.get("prep_talking_points", [])
-        _report_lines = [
-            f"# Opponent Prep: {_fixture_home} vs {_fixture_away} ({_venue_label})",
-            f"\n**Season:** {opp.get('season', '')} · **Competition:** {opp.get('competition', '')} · **Venue:** {_venue_label}\n",
-            "## Tactical brief (match-day)",
-            f"- **Formations:** Our team {st.session_state.get('prep_our_formation', '4-3-3')} · Opponent {st.session_state.get('prep_opp_formation', '4-3-3')}",
-            "- **Three non-negotiables:**",
-            f"  1. {_n1 or '(not set)'}",
-            f"  2. {_n2 or '(not set)'}",
-            f"  3. {_n3 or '(not set)'}",
-            "- **Staff talking points:**",
-            *("  - " + t for t in _tp),
-            "",
-            "## Formations",
-            f"- **Our team:** {st.session_state.get('prep_our_formation', '4-3-3')}",
-            f"- **Opponent:** {st.session_state.get('prep_opp_formation', '4-3-3')}",
-            "",
-            "## Tactical summary",
-            st.session_state.get("prep_predicted", ""),
-            "## Threats",
-            *("- " + t for t in st.session_state.get("prep_threats", [])),
-            "## Weaknesses",
-            *("- " + w for w in st.session_state.get("prep_weaknesses", [])),
-            "## Key players to watch",
-            *(
-                "- **" + p.get("name", "?") + "** (" + str(p.get("role", p.get("position", ""))) + ") – " + str(p.get("threat_level", ""))
-                + (f" · G:{p.get('goals', 0)} A:{p.get('assists', 0)} xG/90:{p.get('xg90', 0)}" if p.get("goals") is not None or p.get("assists") is not None else "")
-                + (f"\n  - Strengths: {', '.join(p.get('strengths', [])) if isinstance(p.get('strengths'), list) else str(p.get('strengths', ''))}" if p.get("strengths") else "")
-                + (f"\n  - Weaknesses: {p.get('weaknesses', '')}" if p.get("weaknesses") else "")
-                + (f"\n  - Instruction: {p.get('instruction', '')}" if p.get("instruction") else "")
-                for p in st.session_state.get("prep_key_players", [])
-            ),
-            "## Expected duels (by formation)",
-            *([f"- **{r.get('Our slot', '')}** {r.get('Our player', '?')} ({r.get('Our pos', '')}) vs **{r.get('Their slot', '')}** {r.get('Their player', '?')} ({r.get('Their pos', '')})" for r in st.session_state.get("prep_matchup_rows", [])] or ["(Review Full prep tab for expected duels)"]),
-        ]
-        st.session_state["prep_report_md"] = "\n".join(_report_lines)
+        _report = {
+            "home": _fixture_home,
+            "away": _fixture_away,
+            "venue": _venue_label,
+            "season": opp.get("season", ""),
+            "competition": opp.get("competition", ""),
+            "our_formation": st.session_state.get("prep_our_formation", "4-3-3"),
+            "opp_formation": st.session_state.get("prep_opp_formation", "4-3-3"),
+            "non_negotiables": [_n1, _n2, _n3],
+            "talking_points": _tp,
+            "predicted": st.session_state.get("prep_predicted", ""),
+            "threats": st.session_state.get("prep_threats", []),
+            "weaknesses": st.session_state.get("prep_weaknesses", []),
+            "key_players": st.session_state.get("prep_key_players", []),
+            "matchup_rows": st.session_state.get("prep_matchup_rows", []),
+        }
+        st.session_state["prep_report_md"] = _build_prep_report_markdown(_report)
 
     else:
         st.warning("Tactical data not available for one or both teams.")
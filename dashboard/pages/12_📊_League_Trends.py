@@ -26,6 +26,7 @@ from dashboard.utils.data import (
 )
 from dashboard.utils.constants import COMP_NAMES, COMP_FLAGS, TOP_5_LEAGUES
 from dashboard.utils.scope import filter_to_default_scope, CURRENT_SEASON, DEFAULT_COMPETITION_SLUGS
+from dashboard.utils.filters import comp_label_map
 from dashboard.utils.sidebar import render_sidebar
 from dashboard.tactics.components.tactical_components import (
     render_league_trends_dashboard,
@@ -44,21 +45,33 @@ st.set_page_config(
 
 render_sidebar()
 
-# Load data
-with st.spinner("Loading league data…"):
+@st.cache_data(show_spinner=False, ttl=3600)
+def _scoped_frames(top5_only: bool) -> tuple:
+    """Load tactical profiles and team stats, filtered to the default scope.
+
+    Args:
+        top5_only: Further restrict both frames to the top 5 leagues.
+
+    Returns:
+        (tactical_df, team_stats) tuple.
+    """
     tactical_df = load_tactical_profiles()
     team_stats = load_team_season_stats()
+    if not tactical_df.empty:
+        tactical_df = filter_to_default_scope(tactical_df)
+    if not team_stats.empty:
+        team_stats = filter_to_default_scope(team_stats)
+    if top5_only and not tactical_df.empty:
+        tactical_df = tactical_df[tactical_df["competition_slug"].isin(TOP_5_LEAGUES)]
+    if top5_only and not team_stats.empty:
+        team_stats = team_stats[team_stats["competition_slug"].isin(TOP_5_LEAGUES)]
+    return tactical_df, team_stats
+
 
 # Scope selector (improvement #48): season + Top 5 vs All
-if not tactical_df.empty:
-    tactical_df = filter_to_default_scope(tactical_df)
-if not team_stats.empty:
-    team_stats = filter_to_default_scope(team_stats)
 scope_label = st.radio("Scope", options=["Leagues + UEFA (default)", "Top 5 leagues only"], index=0, key="trends_scope", horizontal=True)
-if scope_label == "Top 5 leagues only" and not tactical_df.empty:
-    tactical_df = tactical_df[tactical_df["competition_slug"].isin(TOP_5_LEAGUES)]
-if scope_label == "Top 5 leagues only" and not team_stats.empty:
-    team_stats = team_stats[team_stats["competition_slug"].isin(TOP_5_LEAGUES)]
+with st.spinner("Loading league data…"):
+    tactical_df, team_stats = _scoped_frames(scope_label == "Top 5 leagues only")
 
 # Empty state (improvement #49)
 if tactical_df.empty:
@@ -288,10 +301,11 @@ st.markdown("<div class='section-header'>🔗 Team Similarity Analysis</div>", u
 st.markdown("Compare teams based on their tactical profiles to find similar playing styles.")
 
 # League selector for similarity
+_league_options = sorted(tactical_df_norm["competition_slug"].unique())
 sim_league = st.selectbox(
     "Select league for team similarity analysis:",
-    options=sorted(tactical_df_norm["competition_slug"].unique()),
-    format_func=lambda x: f"{COMP_FLAGS.get(x, '🏆')} {COMP_NAMES.get(x, x)}",
+    options=_league_options,
+    format_func=comp_label_map(tuple(_league_options)).get,
     key="sim_league"
 )
 
@@ -370,8 +384,8 @@ st.markdown("<div class='section-header'>🔍 Team Style Clusters</div>", unsafe
 # League selector for cluster analysis
 selected_league = st.selectbox(
     "Select league to analyze team clusters:",
-    options=sorted(tactical_df_norm["competition_slug"].unique()),
-    format_func=lambda x: f"{COMP_FLAGS.get(x, '🏆')} {COMP_NAMES.get(x, x)}",
+    options=_league_options,
+    format_func=comp_label_map(tuple(_league_options)).get,
     key="cluster_league"
 )
 
@@ -466,10 +480,11 @@ if not team_stats.empty and not tactical_df.empty:
         st.caption("xG per possession point: xG For / (possession_index + 1) × 100. Possession index normalized 0–100. Higher = more attacking output per unit of possession style.")
 
         # Show top efficient teams by league
+        _eff_options = sorted(efficiency_df["competition_slug"].unique())
         league_for_eff = st.selectbox(
             "Select league for efficiency analysis:",
-            options=sorted(efficiency_df["competition_slug"].unique()),
-            format_func=lambda x: f"{COMP_FLAGS.get(x, '🏆')} {COMP_NAMES.get(x, x)}",
+            options=_eff_options,
+            format_func=comp_label_map(tuple(_eff_options)).get,
             key="eff_league"
         )
 
@@ -233,10 +233,8 @@ if "percentile_context" not in st.session_state:
 # Load data
 with st.spinner("Loading player data…"):
     df_all = load_enriched_season_stats()
-    form_df = load_rolling_form()
     consistency_df = load_player_consistency()
     opponent_df = load_opponent_context_summary()
-    profiles_df = load_scouting_profiles()
     team_stats_df = load_team_season_stats()
     tactical_df = load_tactical_profiles()
     try:
@@ -248,25 +246,115 @@ with st.spinner("Loading player data…"):
     except Exception:
         progression_df = pd.DataFrame()
 
+@st.cache_resource(show_spinner=False, ttl=3600)
+def _rolling_form() -> pd.DataFrame:
+    """Shared (read-only) rolling form table; loaded only once a player's summary is rendered."""
+    return load_rolling_form()
+
+
+@st.cache_resource(show_spinner=False, ttl=3600)
+def _scouting_profiles() -> pd.DataFrame:
+    """Shared (read-only) scouting profiles table; loaded only once a player's summary is rendered."""
+    return load_scouting_profiles()
+
+
+def _top_k_by(frame: pd.DataFrame, col: str, k: int) -> pd.DataFrame:
+    """Rows with the k largest values of col, descending (NaN last), via argpartition.
+
+    Equivalent to frame.sort_values(col, ascending=False).head(k) without sorting every row.
+    """
+    neg = -frame[col].to_numpy(dtype=float, na_value=np.nan)
+    k = min(k, len(neg))
+    if k == 0:
+        return frame.iloc[:0]
+    idx = np.argpartition(neg, k - 1)[:k]
+    return frame.iloc[idx[np.argsort(neg[idx], kind="stable")]]
+
+
+def _fill_blank_labels(frame: pd.DataFrame, cols: Tuple[str, ...] = ("team", "league_name")) -> pd.DataFrame:
+    """Replace NaN/empty team and league labels with "—" for the whole frame at once."""
+    return frame.assign(**{
+        col: frame[col].fillna("—").replace({"": "—"}) for col in cols if col in frame.columns
+    })
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _top_performers(k: int = 20) -> pd.DataFrame:
+    """Top k players by minutes-weighted rating in the default scope (current season).
+
+    Only depends on load_enriched_season_stats(), so the aggregation runs once per data
+    load instead of on every rerun of the landing view.
+
+    Args:
+        k: Number of players to return.
+
+    Returns:
+        DataFrame with player_id, player_name, player_position, team, league_name; empty if unavailable.
+    """
+    df = load_enriched_season_stats()
+    if df.empty or "avg_rating" not in df.columns or "total_minutes" not in df.columns:
+        return pd.DataFrame()
+    # Project before scoping: filter_to_default_scope copies its result, so only the
+    # columns used below get copied instead of the whole wide season-stats frame
+    cols = ["player_id", "player_name", "player_position", "team", "league_name", "total_minutes", "avg_rating"]
+    df_scope = filter_to_default_scope(df[cols + [c for c in ("season", "competition_slug") if c in df.columns]])
+    if df_scope.empty:
+        return pd.DataFrame()
+    df_scope = df_scope[cols]
+    # Per-player sums via factorize + bincount (NaN contributes 0, like groupby.sum)
+    codes, uniques = pd.factorize(df_scope["player_id"], sort=True)
+    keep = codes >= 0
+    # float32 loads/multiply (ratings ~0-10, minutes are whole numbers); bincount accumulates in float64
+    mins = np.nan_to_num(df_scope["total_minutes"].to_numpy(dtype=np.float32, na_value=np.nan))[keep]
+    rating = df_scope["avg_rating"].to_numpy(dtype=np.float32, na_value=np.nan)[keep]
+    tm = np.bincount(codes[keep], weights=mins, minlength=len(uniques))
+    sw = np.bincount(codes[keep], weights=np.nan_to_num(rating * mins), minlength=len(uniques))
+    agg = pd.DataFrame({"total_minutes": tm}, index=pd.Index(uniques, name="player_id"))
+    # Minutes-weighted rating in one numpy divide (NaN where minutes are 0/invalid)
+    agg["avg_rating"] = np.divide(
+        sw, tm, out=np.full_like(sw, np.nan), where=np.isfinite(tm) & (tm != 0) & np.isfinite(sw)
+    )
+    # Primary row = most minutes per player; a stable sort keeps idxmax's first-on-tie choice
+    primary = (
+        df_scope.sort_values("total_minutes", ascending=False, kind="stable")
+        .drop_duplicates("player_id")
+        .set_index("player_id")[["player_name", "player_position", "team", "league_name"]]
+    )
+    agg = agg.join(primary)
+    # Threshold on the busiest player's season total, reusing the bincount output (no extra column scan)
+    max_mins = float(tm.max()) if tm.size else 0.0
+    if max_mins and max_mins > 0:
+        min_mins = 0.5 * max_mins
+        agg = _top_k_by(agg[agg["total_minutes"] >= min_mins], "avg_rating", k)
+    else:
+        agg = _top_k_by(agg, "avg_rating", k)
+    return _fill_blank_labels(agg.reset_index()[["player_id", "player_name", "player_position", "team", "league_name"]])
+
+
 def _load_shortlist_for_profile() -> list:
     """Load shortlist from file for profile page."""
     return load_shortlist_from_file()
 
 
-def _render_player_row(player: Any, rank: Optional[int] = None) -> None:
-    """Render one player row with optional rank. Caller must use st.columns([4,1,1])."""
-    pos_label = POSITION_NAMES.get(player.get("player_position"), player.get("player_position", ""))
-    team = player.get("team", "") or "—"
-    league = player.get("league_name", "") or "—"
-    rank_str = f"#{rank}" if rank is not None else ""
-    st.markdown(
-        f"""
+_PLAYER_ROW_TPL = """
         <div class="top-list-row">
             <span class="top-list-rank">{rank_str}</span>
-            <span class="top-list-name">{player.get('player_name', '')}</span>
+            <span class="top-list-name">{player_name}</span>
             <span class="top-list-meta">{pos_label} · {team} · {league}</span>
         </div>
-        """,
+        """
+
+
+def _render_player_row(player: Any, rank: Optional[int] = None) -> None:
+    """Render one player row with optional rank. Caller must use st.columns([4,1,1])."""
+    st.markdown(
+        _PLAYER_ROW_TPL.format(
+            rank_str=f"#{rank}" if rank is not None else "",
+            player_name=player.get("player_name", ""),
+            pos_label=POSITION_NAMES.get(player.get("player_position"), player.get("player_position", "")),
+            team=player.get("team", "") or "—",
+            league=player.get("league_name", "") or "—",
+        ),
         unsafe_allow_html=True,
     )
 
@@ -312,8 +400,7 @@ if player_id is None or player_id not in df_all["player_id"].values:
     if not shortlist_df.empty:
         st.markdown("<div class='section-header'>🎯 Your shortlist</div>", unsafe_allow_html=True)
         st.caption("Players you’re tracking. Open a profile or add to Compare.")
-        for _, row in shortlist_df.iterrows():
-            p = row.to_dict()
+        for p in shortlist_df.to_dict("records"):
             pid = p["player_id"]
             cols = st.columns([4, 1, 1])
             with cols[0]:
@@ -349,17 +436,16 @@ if player_id is None or player_id not in df_all["player_id"].values:
 
     if has_search or has_position:
         # Search/filter active: show all matches (cap at 50)
-        matching = df_all.copy()
+        mask = np.ones(len(df_all), dtype=bool)
         if has_search:
-            matching = matching[matching["player_name"].str.contains(search_term.strip(), case=False, na=False)]
+            mask &= df_all["player_name"].str.contains(search_term.strip(), case=False, regex=False, na=False).to_numpy()
         if has_position:
-            matching = matching[matching["player_position"].isin(position_filter)]
-        matching = matching[["player_id", "player_name", "player_position", "team", "league_name"]].drop_duplicates("player_id")
-        matching = matching.head(50)
+            mask &= df_all["player_position"].isin(position_filter).to_numpy()
+        matching = df_all.loc[mask, ["player_id", "player_name", "player_position", "team", "league_name"]].drop_duplicates("player_id")
+        matching = _fill_blank_labels(matching.head(50))
         if not matching.empty:
             st.markdown(f"**Found {len(matching)} player(s)** — select one to open their profile.")
-            for _, row in matching.iterrows():
-                p = row.to_dict()
+            for p in matching.to_dict("records"):
                 pid = p["player_id"]
                 cols = st.columns([4, 1, 1])
                 with cols[0]:
@@ -378,33 +464,11 @@ if player_id is None or player_id not in df_all["player_id"].values:
             st.info("No players found. Try a different name or position, or use **Find players** to explore.")
     else:
         # No search: show top 20 by rating (default scope) so the list is meaningful
-        df_scope = filter_to_default_scope(df_all)
-        if not df_scope.empty and "avg_rating" in df_scope.columns and "total_minutes" in df_scope.columns:
-            df_scope = df_scope.copy()
-            df_scope["_w"] = df_scope["avg_rating"] * df_scope["total_minutes"]
-            g = df_scope.groupby("player_id")
-            agg = g.agg(total_minutes=("total_minutes", "sum"), _sum_w=("_w", "sum"))
-            agg["avg_rating"] = agg.apply(
-                lambda r: safe_divide(r["_sum_w"], r["total_minutes"], default=np.nan),
-                axis=1,
-            )
-            idx = df_scope.groupby("player_id")["total_minutes"].idxmax()
-            primary = df_scope.loc[idx, ["player_id", "player_name", "player_position", "team", "league_name"]].set_index("player_id")
-            agg = agg.join(primary)
-            max_mins = float(df_scope["total_minutes"].max())
-            if max_mins and max_mins > 0:
-                min_mins = 0.5 * max_mins
-                agg = agg[agg["total_minutes"] >= min_mins].sort_values("avg_rating", ascending=False).head(20)
-            else:
-                agg = agg.sort_values("avg_rating", ascending=False).head(20)
-            matching = agg.reset_index()[["player_id", "player_name", "player_position", "team", "league_name"]]
-        else:
-            matching = pd.DataFrame()
+        matching = _top_performers()
 
         if not matching.empty:
             st.caption(f"Top 20 by season rating ({CURRENT_SEASON}, main leagues + UEFA). Or search by name or filter by position above.")
-            for i, (_, row) in enumerate(matching.iterrows(), start=1):
-                p = row.to_dict()
+            for i, p in enumerate(matching.to_dict("records"), start=1):
                 pid = p["player_id"]
                 cols = st.columns([4, 1, 1])
                 with cols[0]:
@@ -788,6 +852,8 @@ else:
 
 # ---------- 3. Executive summary / narrative ----------
 st.markdown("<div class='section-header'>📝 Executive summary</div>", unsafe_allow_html=True)
+form_df = _rolling_form()
+profiles_df = _scouting_profiles()
 # Rolling form (07) may not have season/competition_slug; filter only on existing columns
 _base = form_df[form_df["player_id"] == player_id] if not form_df.empty and "player_id" in form_df.columns else pd.DataFrame()
 if _base.empty:
@@ -82,6 +82,24 @@ def _apply_profile_to_df(df: pd.DataFrame, profile_key: str) -> pd.DataFrame:
         return out
     return df
 
+@st.cache_data(show_spinner=False, ttl=3600)
+def _coverage_stats() -> tuple:
+    """Players, competitions, seasons and appearances for the Coverage footer.
+
+    Counted once per data load rather than scanning the season stats on every rerun.
+
+    Returns:
+        Tuple (n_players, n_competitions, n_seasons, n_appearances).
+    """
+    df = load_enriched_season_stats()
+    # factorize skips NaN like nunique() but avoids its generic per-dtype dispatch
+    return (
+        pd.factorize(df["player_id"])[1].size,
+        pd.factorize(df["competition_slug"])[1].size,
+        pd.factorize(df["season"])[1].size,
+        int(df["appearances"].sum()),
+    )
+
 # Page config
 st.set_page_config(
     page_title="Compare Players · Scouts",
@@ -770,11 +788,12 @@ st.markdown("---")
 st.markdown("<div class='section-header'>Coverage</div>", unsafe_allow_html=True)
 st.markdown("<div class='kpi-accent' aria-hidden='true'></div>", unsafe_allow_html=True)
 if df_all is not None and not df_all.empty:
+    _n_players, _n_comps, _n_seasons, _n_apps = _coverage_stats()
     _c1, _c2, _c3, _c4 = st.columns(4)
-    _c1.metric("Players", f"{df_all['player_id'].nunique():,}")
-    _c2.metric("Competitions", df_all["competition_slug"].nunique())
-    _c3.metric("Seasons", df_all["season"].nunique())
-    _c4.metric("Appearances", f"{int(df_all['appearances'].sum()):,}")
+    _c1.metric("Players", f"{_n_players:,}")
+    _c2.metric("Competitions", _n_comps)
+    _c3.metric("Seasons", _n_seasons)
+    _c4.metric("Appearances", f"{_n_apps:,}")
 st.markdown(
     '<p class="data-attribution">Data sourced from SofaScore. Default scope: current season, leagues + UEFA. Use <strong>Find players</strong> to change scope.</p>',
     unsafe_allow_html=True,
@@ -5,6 +5,7 @@ Track and manage target players with status tags, notes, and alerts.
 
 import sys
 import pathlib
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Optional, Tuple
 
@@ -163,11 +164,8 @@ if _spot_player and (_spot_row is not None or _spot_player.get("name")):
 # Overview (status counts) + Not in data
 # ---------------------------------------------------------------------------
 if st.session_state.get("shortlist", []):
-    status_counts = {}
-    for player in st.session_state.shortlist:
-        status = player.get("status", "Watching")
-        status_counts[status] = status_counts.get(status, 0) + 1
-    
+    status_counts = Counter(p.get("status", "Watching") for p in st.session_state.shortlist)
+
     st.markdown("<div class='section-header'>📊 Overview</div>", unsafe_allow_html=True)
     st.markdown("<div class='kpi-accent' aria-hidden='true'></div>", unsafe_allow_html=True)
     cols = st.columns(len(STATUS_OPTIONS))
@@ -188,14 +186,20 @@ if st.session_state.get("shortlist", []):
 
     # Players not in current data (e.g. transferred out)
     ids_in_data = set(df_all["player_id"].unique()) if not df_all.empty else set()
-    shortlist_ids = [p.get("id") for p in st.session_state.shortlist if p.get("id") is not None]
-    not_in_data = [pid for pid in shortlist_ids if pid not in ids_in_data]
+    # One pass over the shortlist: first name per id, then O(1) lookups below
+    name_by_id = {}
+    for p in st.session_state.shortlist:
+        pid = p.get("id")
+        if pid is not None and pid not in name_by_id:
+            name_by_id[pid] = p.get("name", str(pid))
+    not_in_data = [pid for pid in name_by_id if pid not in ids_in_data]
     if not_in_data:
         st.markdown("<div class='section-header'>⚠️ Not in current data</div>", unsafe_allow_html=True)
-        names_not = [next((p.get("name", str(pid)) for p in st.session_state.shortlist if p.get("id") == pid), str(pid)) for pid in not_in_data]
+        names_not = [name_by_id[pid] for pid in not_in_data]
         st.caption(f"{len(not_in_data)} player(s) on your shortlist are not in the current dataset (e.g. transferred out): {', '.join(names_not[:5])}{'…' if len(names_not) > 5 else ''}.")
         if st.button("Remove these from shortlist", key="remove_not_in_data"):
-            st.session_state.shortlist = [p for p in st.session_state.shortlist if p.get("id") not in not_in_data]
+            _missing = set(not_in_data)
+            st.session_state.shortlist = [p for p in st.session_state.shortlist if p.get("id") not in _missing]
             save_shortlist_to_file(st.session_state.shortlist)
             st.toast(f"Removed {len(not_in_data)} player(s)")
             st.rerun()
@@ -204,6 +208,72 @@ if st.session_state.get("shortlist", []):
 # ---------------------------------------------------------------------------
 # Filter and display shortlist
 # ---------------------------------------------------------------------------
+# st.fragment needs Streamlit 1.37+ (experimental_fragment from 1.33); plain call otherwise
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda fn: fn)
+MAX_NOTE_LENGTH = 2000
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _player_positions() -> dict:
+    """Return player_id -> player_position (first row per player) for the position filter.
+
+    Built once from the cached season stats so filtering the shortlist is a dict
+    lookup per player instead of a full-frame scan on every rerun.
+    """
+    df = load_enriched_season_stats()
+    if df.empty or "player_position" not in df.columns:
+        return {}
+    first = df.drop_duplicates("player_id")
+    return dict(zip(first["player_id"], first["player_position"]))
+
+
+@_fragment
+def _render_notes_editor(player: dict, notes_dt) -> None:
+    """Notes text area, counter and save button for one shortlisted player.
+
+    Runs as a fragment where supported, so editing notes reruns only this block
+    instead of every card on the page.
+    """
+    player_id = player.get("id")
+    notes_key = f"notes_{player_id}"
+    current_notes = player.get("notes", "")
+
+    new_notes = st.text_area(
+        "Scouting notes:",
+        value=current_notes,
+        placeholder="Add your observations here...",
+        key=notes_key,
+        label_visibility="collapsed",
+        max_chars=MAX_NOTE_LENGTH,
+    )
+    st.caption(f"Characters: {len(new_notes)} / {MAX_NOTE_LENGTH}")
+
+    # Show last updated timestamp when available
+    notes_updated = player.get("notes_updated_at")
+    if notes_updated:
+        if pd.notna(notes_dt):
+            st.caption(f"Last updated: {notes_dt.strftime('%d %b %Y, %H:%M')}")
+        else:
+            st.caption(f"Last updated: {notes_updated}")
+    col_save, col_cancel = st.columns([1, 4])
+    with col_save:
+        if st.button("💾 Save Notes", key=f"save_notes_{player_id}"):
+            if len(new_notes) > MAX_NOTE_LENGTH:
+                st.error(f"Notes are too long. Please keep them under {MAX_NOTE_LENGTH} characters (current: {len(new_notes)}).")
+            else:
+                now = datetime.now(timezone.utc).isoformat()
+                player["notes"] = new_notes
+                player["notes_updated_at"] = now
+                if not player.get("notes_created_at"):
+                    player["notes_created_at"] = now
+                try:
+                    save_shortlist_to_file(st.session_state.shortlist)
+                    st.toast("Notes saved!")
+                    st.rerun()
+                except (IOError, OSError):
+                    st.error("Could not save notes. Check file permissions or disk space.")
+
+
 st.markdown("<div class='section-header'>🔍 Filter shortlist</div>", unsafe_allow_html=True)
 col1, col2, col3 = st.columns(3)
 with col1:
@@ -224,24 +294,30 @@ with col3:
     )
 st.markdown("<div class='section-header'>👥 Tracked players</div>", unsafe_allow_html=True)
 
-filtered_shortlist = st.session_state.get("shortlist", []).copy()
-if filter_status:
-    filtered_shortlist = [p for p in filtered_shortlist if p.get("status") in filter_status]
-if filter_search:
-    filtered_shortlist = [p for p in filtered_shortlist if filter_search.lower() in p.get("name", "").lower()]
-if filter_position:
-    def _player_position(pid):
-        rows = df_all[df_all["player_id"] == pid]
-        if not rows.empty:
-            return rows.iloc[0].get("player_position", None)
-        return None
-    filtered_shortlist = [p for p in filtered_shortlist if _player_position(p.get("id")) in filter_position]
+# All filters in one pass; the query is lowered once, not per player
+_status_set = set(filter_status)
+_search_q = filter_search.lower() if filter_search else ""
+_position_set = set(filter_position)
+_position_by_id = _player_positions() if _position_set else {}
+filtered_shortlist = [
+    p for p in st.session_state.get("shortlist", [])
+    if (not _status_set or p.get("status") in _status_set)
+    and (not _search_q or _search_q in p.get("name", "").lower())
+    and (not _position_set or _position_by_id.get(p.get("id")) in _position_set)
+]
 
 if not filtered_shortlist:
     st.info("No players match your filters. Clear filters above or use **Find players** to add more.")
 else:
+        # Parse every note timestamp in one vectorized call instead of per card
+        notes_dates = pd.to_datetime(
+            pd.Series([p.get("notes_updated_at") for p in filtered_shortlist], dtype=object),
+            errors="coerce",
+            utc=True,
+            format="ISO8601",
+        ).tolist()
         # Display each player
-        for player in filtered_shortlist:
+        for player, notes_dt in zip(filtered_shortlist, notes_dates):
             player_id = player.get("id")
             player_name = player.get("name", "Unknown")
             status = player.get("status", "Watching")
@@ -311,16 +387,11 @@ else:
                     # Note preview (~50 chars) and last updated
                     raw_notes = (player.get("notes") or "").strip()
                     has_notes = bool(raw_notes)
-                    notes_updated_at = player.get("notes_updated_at")
                     if has_notes:
                         preview = (raw_notes[:50] + "…") if len(raw_notes) > 50 else raw_notes
                         preview_safe = preview.replace("<", "&lt;").replace(">", "&gt;").replace("\n", " ")
-                        if notes_updated_at:
-                            try:
-                                dt = datetime.fromisoformat(notes_updated_at.replace("Z", "+00:00"))
-                                notes_label = f"📝 {preview_safe} <span style='color:#6E7681;'>({dt.strftime('%d %b')})</span>"
-                            except Exception:
-                                notes_label = f"📝 {preview_safe}"
+                        if pd.notna(notes_dt):
+                            notes_label = f"📝 {preview_safe} <span style='color:#6E7681;'>({notes_dt.strftime('%d %b')})</span>"
                         else:
                             notes_label = f"📝 {preview_safe}"
                     else:
@@ -359,47 +430,9 @@ else:
                         st.rerun()
                 
                 # Notes expander (max length + character count + friendly error)
-                MAX_NOTE_LENGTH = 2000
                 with st.expander("📝 Notes", expanded=False):
-                    notes_key = f"notes_{player_id}"
-                    current_notes = player.get("notes", "")
-                    
-                    new_notes = st.text_area(
-                        "Scouting notes:",
-                        value=current_notes,
-                        placeholder="Add your observations here...",
-                        key=notes_key,
-                        label_visibility="collapsed",
-                        max_chars=MAX_NOTE_LENGTH,
-                    )
-                    st.caption(f"Characters: {len(new_notes)} / {MAX_NOTE_LENGTH}")
-                    
-                    # Show last updated timestamp when available
-                    notes_updated = player.get("notes_updated_at")
-                    if notes_updated:
-                        try:
-                            dt = datetime.fromisoformat(notes_updated.replace("Z", "+00:00"))
-                            st.caption(f"Last updated: {dt.strftime('%d %b %Y, %H:%M')}")
-                        except Exception:
-                            st.caption(f"Last updated: {notes_updated}")
-                    col_save, col_cancel = st.columns([1, 4])
-                    with col_save:
-                        if st.button("💾 Save Notes", key=f"save_notes_{player_id}"):
-                            if len(new_notes) > MAX_NOTE_LENGTH:
-                                st.error(f"Notes are too long. Please keep them under {MAX_NOTE_LENGTH} characters (current: {len(new_notes)}).")
-                            else:
-                                now = datetime.now(timezone.utc).isoformat()
-                                player["notes"] = new_notes
-                                player["notes_updated_at"] = now
-                                if not player.get("notes_created_at"):
-                                    player["notes_created_at"] = now
-                                try:
-                                    save_shortlist_to_file(st.session_state.shortlist)
-                                    st.toast("Notes saved!")
-                                    st.rerun()
-                                except (IOError, OSError):
-                                    st.error("Could not save notes. Check file permissions or disk space.")
-                
+                    _render_notes_editor(player, notes_dt)
+
                 st.markdown("---")
 
 # ---------------------------------------------------------------------------
@@ -415,7 +448,8 @@ if st.session_state.get("shortlist", []):
         c1, c2 = st.columns(2)
         with c1:
             if st.button("✅ Yes, remove"):
-                st.session_state.shortlist = [p for p in st.session_state.shortlist if p["id"] not in ids_to_remove]
+                _remove_set = set(ids_to_remove)
+                st.session_state.shortlist = [p for p in st.session_state.shortlist if p["id"] not in _remove_set]
                 save_shortlist_to_file(st.session_state.shortlist)
                 st.session_state.confirm_bulk_remove_ids = None
                 st.toast(f"Removed {len(ids_to_remove)} player(s)")
@@ -454,8 +488,9 @@ if st.session_state.get("shortlist", []):
                     st.toast(f"Added {min(5, len(selected_for_bulk))} to compare")
                     st.switch_page("pages/3_⚖️_Compare.py")
                 elif bulk_action == "Change Status" and new_bulk_status:
+                    _selected_set = set(selected_for_bulk)
                     for p in st.session_state.shortlist:
-                        if p["id"] in selected_for_bulk:
+                        if p["id"] in _selected_set:
                             p["status"] = new_bulk_status
                     save_shortlist_to_file(st.session_state.shortlist)
                     st.toast(f"Updated {len(selected_for_bulk)} players")
@@ -471,12 +506,20 @@ if st.session_state.get("shortlist", []):
     st.markdown("---")
     st.markdown("<div class='section-header'>📤 Export</div>", unsafe_allow_html=True)
     
-    # Prepare export data
+    # Prepare export data: latest-season row per shortlisted player in one pass, then O(1) lookups
+    # (a NaN season sorts last, so it is only picked when a player has no other row)
+    _shortlist_ids = [p.get("id") for p in st.session_state.shortlist]
+    latest_by_player = (
+        df_all[df_all["player_id"].isin(_shortlist_ids)]
+        .sort_values("season", ascending=False, kind="stable")
+        .drop_duplicates("player_id")
+        .set_index("player_id")
+        if not df_all.empty else pd.DataFrame()
+    )
     export_data = []
     for player in st.session_state.shortlist:
-        player_data = df_all[df_all["player_id"] == player.get("id")]
-        if not player_data.empty:
-            latest = player_data.sort_values("season", ascending=False).iloc[0]
+        if player.get("id") in latest_by_player.index:
+            latest = latest_by_player.loc[player.get("id")]
             export_data.append({
                 "Player": player.get("name", "Unknown"),
                 "Status": player.get("status", "Watching"),
@@ -25,6 +25,7 @@ from dashboard.utils.constants import (
     COMP_NAMES, COMP_FLAGS, POSITION_NAMES, MIN_MINUTES_DEFAULT,
 )
 from dashboard.utils.charts import rating_trend
+from dashboard.utils.filters import comp_label_map
 from dashboard.utils.sidebar import render_sidebar
 
 st.set_page_config(page_title="Explore · Schlouh", page_icon="📊", layout="wide")
@@ -393,11 +394,12 @@ def _render_league_tab(df_all: pd.DataFrame) -> None:
     st.markdown("<div class='section-header'>League Comparison</div>", unsafe_allow_html=True)
 
     l1, l2, l3 = st.columns(3)
+    _league_options = sorted(df_all["competition_slug"].unique())
     with l1:
         league_compare_league = st.selectbox(
             "League to analyze",
-            options=sorted(df_all["competition_slug"].unique()),
-            format_func=lambda x: f"{COMP_FLAGS.get(x,'🏆')} {COMP_NAMES.get(x,x)}",
+            options=_league_options,
+            format_func=comp_label_map(tuple(_league_options)).get,
             key="league_analyze",
         )
     with l2:
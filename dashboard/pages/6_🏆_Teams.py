@@ -36,6 +36,7 @@ from dashboard.utils.constants import (
     COMP_NAMES, COMP_FLAGS, TACTICAL_INDEX_LABELS, TACTICAL_TAGS, PLAYER_COLORS, MIN_MINUTES_DEFAULT,
 )
 from dashboard.utils.charts import radar_chart
+from dashboard.utils.filters import comp_label_map
 from dashboard.utils.sidebar import render_sidebar
 
 
@@ -46,6 +47,27 @@ def _normalize_team_search(text: str) -> str:
     return unicode_normalize("NFKD", str(text).lower()).encode("ASCII", "ignore").decode()
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
+def _teams_for_comp_season(team_comp: str, team_season: str) -> list:
+    """Sorted team names for a league/season, cached so search-box reruns skip the scan."""
+    df = load_team_season_stats()
+    names = df.loc[
+        (df["competition_slug"] == team_comp) & (df["season"] == team_season), "team_name"
+    ]
+    if isinstance(names.dtype, pd.CategoricalDtype):
+        # Parquet round-trips categoricals; the used categories are already unique
+        return names.cat.remove_unused_categories().cat.categories.sort_values().tolist()
+    teams = pd.unique(names.dropna().to_numpy())
+    teams.sort()
+    return teams.tolist()
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _team_search_index(team_comp: str, team_season: str) -> pd.Index:
+    """Normalized (lowercase, accent-free) names aligned with _teams_for_comp_season."""
+    return pd.Index([_normalize_team_search(t) for t in _teams_for_comp_season(team_comp, team_season)])
+
+
 def _wdl_from_matches(matches_df: pd.DataFrame, team_score_col: str, opp_score_col: str) -> dict:
     """Compute W-D-L from a DataFrame of matches where team score and opp score columns are known."""
     wins = draws = losses = 0
@@ -435,6 +457,53 @@ def _render_playing_style(
                 )
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
+def _team_match_log(
+    team_name: str,
+    team_season: str,
+    team_comp: str,
+    home_col: str,
+    away_col: str,
+    date_col: str | None,
+    score_h_col: str | None,
+    score_a_col: str | None,
+) -> pd.DataFrame:
+    """Team's matches for a league/season, newest first, with _is_home and result columns.
+
+    Cached so widget reruns on the Matches tab skip the filter, sort and result pass.
+    """
+    df_matches = load_match_summary()
+    mask = (
+        ((df_matches[home_col] == team_name) | (df_matches[away_col] == team_name)) &
+        (df_matches["season"] == team_season) &
+        (df_matches["competition_slug"] == team_comp)
+    )
+    team_matches = df_matches[mask].copy()
+    if date_col:
+        team_matches = team_matches.sort_values(date_col, ascending=False)
+    if team_matches.empty:
+        return team_matches
+
+    # Home/away membership computed once and reused for results and xG
+    is_home = (team_matches[home_col] == team_name).to_numpy()
+    team_matches["_is_home"] = is_home
+
+    # Add result indicator
+    if score_h_col and score_a_col:
+        gh = pd.to_numeric(team_matches[score_h_col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        ga = pd.to_numeric(team_matches[score_a_col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        goals_for = np.where(is_home, gh, ga)
+        goals_against = np.where(is_home, ga, gh)
+        team_matches["result"] = np.select(
+            [goals_for > goals_against, goals_for == goals_against, goals_for < goals_against],
+            ["W", "D", "L"],
+            default="?",
+        )
+    else:
+        team_matches["result"] = "?"
+    return team_matches
+
+
 def _render_matches_tab(
     team_name: str,
     team_season: str,
@@ -456,39 +525,22 @@ def _render_matches_tab(
         st.info("No match data available.")
         return
 
-    mask = (
-        ((df_matches[home_col] == team_name) | (df_matches[away_col] == team_name)) &
-        (df_matches["season"] == team_season) &
-        (df_matches["competition_slug"] == team_comp)
+    team_matches = _team_match_log(
+        team_name, team_season, team_comp, home_col, away_col, date_col, score_h_col, score_a_col
     )
-    team_matches = df_matches[mask].copy()
-    if date_col:
-        team_matches = team_matches.sort_values(date_col, ascending=False)
-
     if team_matches.empty:
         st.info("No match data available.")
         return
 
-    # Add result indicator
-    def get_result(row):
-        if score_h_col and score_a_col and pd.notna(row.get(score_h_col)) and pd.notna(row.get(score_a_col)):
-            gh, ga = int(row[score_h_col]), int(row[score_a_col])
-            if row[home_col] == team_name:
-                return "W" if gh > ga else ("D" if gh == ga else "L")
-            else:
-                return "W" if ga > gh else ("D" if ga == gh else "L")
-        return "?"
-
-    team_matches["result"] = team_matches.apply(get_result, axis=1)
-
     # xG trend
     xg_h = next((c for c in ["home_xg", "xg_home_total"] if c in team_matches.columns), None)
     xg_a = next((c for c in ["away_xg", "xg_away_total"] if c in team_matches.columns), None)
     if xg_h and xg_a:
         st.markdown("<div class='section-header'>xG Trend Over Season</div>", unsafe_allow_html=True)
         team_matches_sorted = team_matches.sort_values(date_col) if date_col else team_matches
-        team_xg = team_matches_sorted.apply(lambda r: r[xg_h] if r[home_col] == team_name else r[xg_a], axis=1)
-        opp_xg = team_matches_sorted.apply(lambda r: r[xg_a] if r[home_col] == team_name else r[xg_h], axis=1)
+        sorted_home = team_matches_sorted["_is_home"].to_numpy()
+        team_xg = np.where(sorted_home, team_matches_sorted[xg_h], team_matches_sorted[xg_a])
+        opp_xg = np.where(sorted_home, team_matches_sorted[xg_a], team_matches_sorted[xg_h])
         fig_xg = go.Figure()
         fig_xg.add_trace(go.Scatter(x=list(range(len(team_matches_sorted))), y=team_xg, mode="lines+markers", name=f"{team_name} xG", line=dict(color=PLAYER_COLORS[0])))
         fig_xg.add_trace(go.Scatter(x=list(range(len(team_matches_sorted))), y=opp_xg, mode="lines+markers", name="Opponent xG", line=dict(color="#6C7A89")))
@@ -507,14 +559,17 @@ def _render_matches_tab(
     st.markdown("<div class='section-header'>Match Fingerprint (Select Match)</div>", unsafe_allow_html=True)
     st.caption("Select a match to see detailed momentum and incident data.")
     match_options = team_matches.reset_index(drop=True)
-    def _match_label(row):
-        d = str(row.get(date_col, ""))[:10] if date_col else "?"
-        h = row.get(home_col, "?")
-        a = row.get(away_col, "?")
-        gh = int(row[score_h_col]) if score_h_col and pd.notna(row.get(score_h_col)) else "?"
-        ga = int(row[score_a_col]) if score_a_col and pd.notna(row.get(score_a_col)) else "?"
-        return f"{d} — {h} {gh}–{ga} {a}"
-    match_labels = [_match_label(row) for _, row in match_options.iterrows()]
+    def _score_labels(col):
+        if not col:
+            return "?"
+        goals = pd.to_numeric(match_options[col], errors="coerce")
+        return np.trunc(goals).astype("Int64").astype(str).where(goals.notna(), "?")
+    date_labels = match_options[date_col].astype(str).str[:10].fillna("?") if date_col else "?"
+    match_labels = (
+        date_labels + " — " + match_options[home_col].astype(str).fillna("?") + " "
+        + _score_labels(score_h_col) + "–" + _score_labels(score_a_col) + " "
+        + match_options[away_col].astype(str).fillna("?")
+    ).tolist()
     sel_match_idx = st.selectbox("Select match", range(len(match_labels)), format_func=lambda i: match_labels[i], key="fingerprint_match")
     sel_match = match_options.iloc[sel_match_idx]
 
@@ -786,17 +841,14 @@ with c1:
     team_comp = st.selectbox(
         "League",
         options=avail_comps,
-        format_func=lambda x: f"{COMP_FLAGS.get(x,'🏆')} {COMP_NAMES.get(x,x)}",
+        format_func=comp_label_map(tuple(avail_comps)).get,
         key="team_comp",
     )
 with c2:
     avail_seasons = sorted(df_teams[df_teams["competition_slug"] == team_comp]["season"].unique(), reverse=True)
     team_season = st.selectbox("Season", options=avail_seasons, key="team_season")
 with c3:
-    avail_teams = sorted(df_teams[
-        (df_teams["competition_slug"] == team_comp) &
-        (df_teams["season"] == team_season)
-    ]["team_name"].unique())
+    avail_teams = _teams_for_comp_season(team_comp, team_season)
 
 # Team search (min 2 chars, normalize accents)
 st.text_input(
@@ -808,7 +860,10 @@ st.text_input(
 )
 team_search = (st.session_state.get("teams_text_search") or "").strip()
 if len(team_search) >= 2:
-    avail_teams = [t for t in avail_teams if _normalize_team_search(team_search) in _normalize_team_search(t)]
+    _search_mask = _team_search_index(team_comp, team_season).str.contains(
+        _normalize_team_search(team_search), regex=False
+    )
+    avail_teams = np.asarray(avail_teams, dtype=object)[np.asarray(_search_mask, dtype=bool)].tolist()
 
 # Pagination: show first 50, then "Load more"
 TEAMS_PAGE_SIZE = 50
@@ -9,6 +9,8 @@ Sections: saved filters, filter panel, aggregation, results table, quick actions
 import sys
 import pathlib
 import json
+import uuid
+from typing import Optional
 
 _project_root = pathlib.Path(__file__).resolve().parent.parent.parent
 if str(_project_root) not in sys.path:
@@ -18,6 +20,11 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 
+try:
+    import numexpr
+except ImportError:  # optional speedup; the numpy mask is the fallback
+    numexpr = None
+
 from dashboard.utils.data import (
     load_enriched_season_stats,
     compute_percentiles,
@@ -41,7 +48,7 @@ from dashboard.utils.filters import (
 )
 from dashboard.utils.scope import filter_to_default_scope, CURRENT_SEASON, DEFAULT_COMPETITION_SLUGS
 from dashboard.utils.sidebar import render_sidebar
-from dashboard.scouts.layout import load_shortlist_from_file, save_shortlist_to_file
+from dashboard.scouts.layout import load_shortlist_from_file, save_shortlist_to_file, read_json_cached
 from dashboard.scouts.compare_state import load_scouts_compare_list, save_scouts_compare_list
 
 # Constants for saved filters (under dashboard/scouts/)
@@ -49,12 +56,12 @@ SAVED_FILTERS_FILE = pathlib.Path(__file__).resolve().parent.parent / "scouts" /
 
 
 def load_saved_filters() -> dict:
-    """Load saved filters from JSON file. Returns {} on missing or error."""
+    """Load saved filters from JSON file (parsed again only after it changes). Returns {} on missing or error."""
     if SAVED_FILTERS_FILE.exists():
         try:
-            with open(SAVED_FILTERS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return data if isinstance(data, dict) else {}
+            data = read_json_cached(SAVED_FILTERS_FILE)
+            # Shallow copy: deleting a saved filter edits this dict, the parse is shared
+            return dict(data) if isinstance(data, dict) else {}
         except (IOError, OSError, json.JSONDecodeError):
             return {}
     return {}
@@ -93,6 +100,91 @@ def _build_filter_summary(config_dict: dict) -> str:
         parts.append(f"{len(teams)} team{'s' if len(teams) != 1 else ''}")
     return " · ".join(parts) if parts else "All filters"
 
+# Per90 and ratio columns from 03_player_season_stats / enriched (weighted avg by total_minutes)
+AGG_PER90_AND_RATIOS = [
+    "expectedGoals_per90", "expectedAssists_per90", "keyPass_per90", "totalTackle_per90",
+    "duelWon_per90", "interceptionWon_per90", "ballRecovery_per90", "totalShots_per90",
+    "onTargetScoringAttempt_per90", "touches_per90", "aerialWon_per90", "totalPass_per90",
+    "pass_accuracy", "pass_accuracy_pct", "duel_win_rate", "aerial_win_rate", "tackle_success_rate",
+    "bigChanceCreated_per90", "blockedScoringAttempt_per90", "totalClearance_per90",
+    "saves_per90", "goodHighClaim_per90", "savedShotsFromInsideTheBox_per90",
+]
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _load_discover_stats() -> pd.DataFrame:
+    """Enriched season stats narrowed for Discover: float32 per90/ratios, int32 counts, categorical keys.
+
+    Halves the bytes the panel filters and per-player aggregation scan; values are only
+    ever shown rounded, and the aggregation still accumulates in float64.
+    """
+    df = load_enriched_season_stats()
+    if df.empty:
+        return df
+    f32 = [c for c in AGG_PER90_AND_RATIOS if c in df.columns and pd.api.types.is_float_dtype(df[c])]
+    if f32:
+        df[f32] = df[f32].astype("float32")
+    # Counts with missing values are float; only true integer columns are narrowed
+    i32 = [c for c in ("appearances", "goals", "assists") if c in df.columns and pd.api.types.is_integer_dtype(df[c])]
+    if i32:
+        df[i32] = df[i32].astype("int32")
+    # Low-cardinality group/filter keys as categoricals: groupby hashes integer codes, isin checks categories
+    cat_cols = [c for c in ("player_position", "team", "league_name", "competition_slug", "season") if c in df.columns]
+    if cat_cols:
+        df[cat_cols] = df[cat_cols].astype("category")
+    return df
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _avail_leagues() -> frozenset:
+    """competition_slug values present in the Discover stats (scanned once, not per rerun)."""
+    df = _load_discover_stats()
+    return frozenset(df["competition_slug"].unique()) if "competition_slug" in df.columns else frozenset()
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _avail_seasons() -> frozenset:
+    """Season values (as str) present in the Discover stats."""
+    df = _load_discover_stats()
+    return frozenset(df["season"].astype(str).unique()) if "season" in df.columns else frozenset()
+
+
+@st.cache_resource(show_spinner=False, ttl=3600)
+def _scope_index() -> tuple:
+    """(n_rows, {(season, competition_slug, player_position): row positions}) for _load_discover_stats().
+
+    Shared between reruns (not copied); scope filters become a walk over the keys and one
+    take() instead of three isin scans of every row. None when a key column is missing.
+    """
+    df = _load_discover_stats()
+    keys = ["season", "competition_slug", "player_position"]
+    if df.empty or not all(c in df.columns for c in keys):
+        return (len(df), None)
+    return (len(df), df.groupby(keys, observed=True, dropna=False).indices)
+
+
+def _scope_rows(df: pd.DataFrame, seasons: list, leagues: Optional[list], positions: Optional[list]) -> Optional[pd.DataFrame]:
+    """Rows of df in the season/league/position scope via _scope_index(), in original order.
+
+    Empty leagues/positions mean "any". Returns None when the index doesn't match df, so
+    callers fall back to the column scans.
+    """
+    n_rows, index = _scope_index()
+    if index is None or n_rows != len(df):
+        return None
+    season_set = set(seasons)
+    league_set = set(leagues) if leagues else None
+    pos_set = set(positions) if positions else None
+    parts = [
+        rows for (season, league, pos), rows in index.items()
+        if season in season_set
+        and (league_set is None or league in league_set)
+        and (pos_set is None or pos in pos_set)
+    ]
+    if not parts:
+        return df.iloc[:0]
+    return df.take(np.sort(np.concatenate(parts)))
+
+
 # Page config
 st.set_page_config(
     page_title="Find Players · Scouts",
@@ -118,7 +210,7 @@ if "discover_percentile_filters" not in st.session_state:
 
 # Load data (needed to init default filter scope)
 with st.spinner("Loading scouting data…"):
-    df_all = load_enriched_season_stats()
+    df_all = _load_discover_stats()
 
 # Data loader error handling
 _critical_cols = ["player_id", "player_name", "player_position", "season"]
@@ -126,6 +218,10 @@ if df_all.empty or not all(c in df_all.columns for c in _critical_cols):
     st.error("Data temporarily unavailable. Please try again.")
     if st.button("Retry", type="primary", key="discover_retry"):
         load_enriched_season_stats.clear()
+        _load_discover_stats.clear()
+        _avail_leagues.clear()
+        _avail_seasons.clear()
+        _scope_index.clear()
         st.rerun()
     st.stop()
 
@@ -134,7 +230,7 @@ qp = st.query_params
 if qp.get("seasons"):
     st.session_state["discover_seasons"] = [s.strip() for s in qp["seasons"].split(",") if s.strip()]
 if qp.get("leagues"):
-    avail = sorted(df_all["competition_slug"].unique())
+    avail = _avail_leagues()
     st.session_state["discover_leagues"] = [s.strip() for s in qp["leagues"].split(",") if s.strip() and s.strip() in avail]
 if qp.get("positions"):
     st.session_state["discover_positions"] = [s.strip() for s in qp["positions"].split(",") if s.strip()]
@@ -252,11 +348,55 @@ st.markdown("""
 """, unsafe_allow_html=True)
 st.markdown("<div class='discover-filter-card'><div class='section-header'>⚙️ Filters</div>", unsafe_allow_html=True)
 if st.button("🔄 Reset to current season only", key="discover_reset_scope", help="Set Season to 2025-26 and Leagues to default (leagues + UEFA)."):
-    st.session_state["discover_seasons"] = [CURRENT_SEASON] if CURRENT_SEASON in df_all["season"].astype(str).unique() else []
-    avail = sorted(df_all["competition_slug"].unique())
+    st.session_state["discover_seasons"] = [CURRENT_SEASON] if CURRENT_SEASON in _avail_seasons() else []
+    avail = _avail_leagues()
     st.session_state["discover_leagues"] = [s for s in DEFAULT_COMPETITION_SLUGS if s in avail]
     st.rerun()
 
+def _new_rule(rule: dict) -> dict:
+    """Copy of a stat/percentile rule with a fresh id; widgets are keyed by the id, not the row index."""
+    return {**rule, "uid": uuid.uuid4().hex[:8]}
+
+
+def _with_uid(rule: dict) -> dict:
+    return rule if rule.get("uid") else _new_rule(rule)
+
+
+def _sync_stat_rule(uid: str) -> None:
+    """on_change: copy one stat rule's widget values back into discover_stat_filters."""
+    ss = st.session_state
+    for rule in ss["discover_stat_filters"]:
+        if rule.get("uid") == uid:
+            rule["stat"] = ss.get(f"stat_filter_stat_{uid}", rule.get("stat"))
+            rule["min"] = ss.get(f"stat_filter_min_{uid}") if ss.get(f"stat_filter_use_min_{uid}") else None
+            rule["max"] = ss.get(f"stat_filter_max_{uid}") if ss.get(f"stat_filter_use_max_{uid}") else None
+            break
+
+
+def _sync_pct_rule(uid: str) -> None:
+    """on_change: copy one percentile rule's widget values back into discover_percentile_filters."""
+    ss = st.session_state
+    for rule in ss["discover_percentile_filters"]:
+        if rule.get("uid") == uid:
+            rule["stat"] = ss.get(f"pct_filter_stat_{uid}", rule.get("stat"))
+            rule["min_pct"] = ss.get(f"pct_filter_min_{uid}", rule.get("min_pct"))
+            rule["max_pct"] = ss.get(f"pct_filter_max_{uid}", rule.get("max_pct"))
+            break
+
+
+def _remove_rule(state_key: str, uid: str) -> None:
+    st.session_state[state_key] = [r for r in st.session_state[state_key] if r.get("uid") != uid]
+
+
+def _add_rule(state_key: str, rule: dict) -> None:
+    st.session_state[state_key] = st.session_state[state_key] + [_new_rule(rule)]
+
+
+def _clear_rules() -> None:
+    st.session_state["discover_stat_filters"] = []
+    st.session_state["discover_percentile_filters"] = []
+
+
 for key in list(st.session_state.keys()):
     if key.startswith("filter_config_"):
         loaded = st.session_state[key]
@@ -274,8 +414,9 @@ for key in list(st.session_state.keys()):
             st.session_state["discover_age_max"] = int(loaded["age_max"])
         if loaded.get("teams"):
             st.session_state["discover_teams"] = loaded["teams"]
-        st.session_state["discover_stat_filters"] = loaded.get("stat_filters", [])
-        pct_loaded = loaded.get("percentile_filters", [])
+        # Fresh rule ids so widget state left from the previous rules doesn't override the preset
+        st.session_state["discover_stat_filters"] = [_new_rule(r) for r in loaded.get("stat_filters", [])]
+        pct_loaded = [_new_rule(r) for r in loaded.get("percentile_filters", [])]
         st.session_state["discover_percentile_filters"] = pct_loaded
         if pct_loaded:
             st.session_state["discover_show_percentile"] = True
@@ -287,7 +428,7 @@ st.markdown("<div class='filter-subsection-label'>Scope</div>", unsafe_allow_htm
 _r1, _r2, _r3 = st.columns(3)
 with _r1:
     st.markdown("<div class='discover-scope-label'>League</div>", unsafe_allow_html=True)
-    _avail = sorted(df_all["competition_slug"].unique())
+    _avail = _avail_leagues()
     _default_leagues = [s for s in DEFAULT_COMPETITION_SLUGS if s in _avail]
     _current = st.session_state.get("discover_leagues", _default_leagues)
     _n = len(_current)
@@ -360,9 +501,11 @@ def _stat_label(k):
     return RANKING_STATS.get(k) or _extra_stat_labels.get(k) or k
 
 MAX_RAW_STAT_FILTERS = 5
-stat_filters = st.session_state.get("discover_stat_filters", [])
-to_remove = None
-for i, rule in enumerate(stat_filters):
+# Rules are edited in place by the widget callbacks; nothing is rebuilt from widget keys per rerun
+stat_filters = [_with_uid(r) for r in st.session_state.get("discover_stat_filters", [])]
+st.session_state["discover_stat_filters"] = stat_filters
+for rule in stat_filters:
+    uid = rule["uid"]
     r1, r2, r3, r4, r5, r6 = st.columns([2, 0.5, 1, 0.5, 1, 0.4])
     with r1:
         default_idx = stat_keys.index(rule["stat"]) if rule.get("stat") in stat_keys else 0
@@ -370,54 +513,39 @@ for i, rule in enumerate(stat_filters):
             "Stat",
             options=stat_keys,
             format_func=_stat_label,
-            key=f"stat_filter_stat_{i}",
+            key=f"stat_filter_stat_{uid}",
             label_visibility="collapsed",
             index=default_idx,
+            on_change=_sync_stat_rule,
+            args=(uid,),
         )
     with r2:
-        use_min = st.checkbox("Min", value=rule.get("min") is not None, key=f"stat_filter_use_min_{i}", label_visibility="collapsed")
+        use_min = st.checkbox("Min", value=rule.get("min") is not None, key=f"stat_filter_use_min_{uid}", label_visibility="collapsed", on_change=_sync_stat_rule, args=(uid,))
     with r3:
-        min_val = st.number_input("Min val", min_value=0.0, value=float(rule["min"]) if rule.get("min") is not None else 0.0, step=0.05, key=f"stat_filter_min_{i}", label_visibility="collapsed", disabled=not use_min)
+        st.number_input("Min val", min_value=0.0, value=float(rule["min"]) if rule.get("min") is not None else 0.0, step=0.05, key=f"stat_filter_min_{uid}", label_visibility="collapsed", disabled=not use_min, on_change=_sync_stat_rule, args=(uid,))
     with r4:
-        use_max = st.checkbox("Max", value=rule.get("max") is not None, key=f"stat_filter_use_max_{i}", label_visibility="collapsed")
+        use_max = st.checkbox("Max", value=rule.get("max") is not None, key=f"stat_filter_use_max_{uid}", label_visibility="collapsed", on_change=_sync_stat_rule, args=(uid,))
     with r5:
-        max_val = st.number_input("Max val", min_value=0.0, value=float(rule["max"]) if rule.get("max") is not None else 10.0, step=0.05, key=f"stat_filter_max_{i}", label_visibility="collapsed", disabled=not use_max)
+        st.number_input("Max val", min_value=0.0, value=float(rule["max"]) if rule.get("max") is not None else 10.0, step=0.05, key=f"stat_filter_max_{uid}", label_visibility="collapsed", disabled=not use_max, on_change=_sync_stat_rule, args=(uid,))
     with r6:
-        if st.button("🗑️", key=f"stat_filter_remove_{i}", help="Remove"):
-            to_remove = i
-if to_remove is not None:
-    stat_filters.pop(to_remove)
-    st.session_state["discover_stat_filters"] = stat_filters
-    st.rerun()
-
-# Rebuild stat_filters from current widget values
-_rebuilt = []
-for i in range(len(stat_filters)):
-    stat_key = st.session_state.get(f"stat_filter_stat_{i}")
-    use_min = st.session_state.get(f"stat_filter_use_min_{i}", False)
-    use_max = st.session_state.get(f"stat_filter_use_max_{i}", False)
-    min_val = st.session_state.get(f"stat_filter_min_{i}") if use_min else None
-    max_val = st.session_state.get(f"stat_filter_max_{i}") if use_max else None
-    if stat_key:
-        _rebuilt.append({"stat": stat_key, "min": min_val, "max": max_val})
-st.session_state["discover_stat_filters"] = _rebuilt
+        st.button("🗑️", key=f"stat_filter_remove_{uid}", help="Remove", on_click=_remove_rule, args=("discover_stat_filters", uid))
 
 # One row: Add stat filter + Percentile toggle + Clear (same button style)
 _btn1, _btn2, _btn3 = st.columns([1, 1, 0.6])
 with _btn1:
-    if len(stat_filters) < MAX_RAW_STAT_FILTERS and st.button("➕ Add stat filter", key="add_stat_filter", use_container_width=True):
-        st.session_state["discover_stat_filters"] = _rebuilt + [{"stat": "expectedGoals_per90", "min": None, "max": None}]
-        st.rerun()
+    if len(stat_filters) < MAX_RAW_STAT_FILTERS:
+        st.button(
+            "➕ Add stat filter", key="add_stat_filter", use_container_width=True,
+            on_click=_add_rule, args=("discover_stat_filters", {"stat": "expectedGoals_per90", "min": None, "max": None}),
+        )
 with _btn2:
     _pct_label = "▼ Hide percentile filters" if st.session_state["discover_show_percentile"] else "➕ Also filter by percentile (optional)"
     if st.button(_pct_label, key="toggle_percentile", use_container_width=True):
         st.session_state["discover_show_percentile"] = not st.session_state["discover_show_percentile"]
         st.rerun()
 with _btn3:
-    if (stat_filters or st.session_state["discover_percentile_filters"]) and st.button("Clear all", key="clear_stat_filters", use_container_width=True):
-        st.session_state["discover_stat_filters"] = []
-        st.session_state["discover_percentile_filters"] = []
-        st.rerun()
+    if stat_filters or st.session_state["discover_percentile_filters"]:
+        st.button("Clear all", key="clear_stat_filters", use_container_width=True, on_click=_clear_rules)
 
 # Percentile filter block (shown when toggled on, same visual weight as stat filters)
 pct_stat_options = [
@@ -427,35 +555,24 @@ pct_stat_options = [
 ]
 if st.session_state["discover_show_percentile"]:
     st.caption("Percentiles are vs position in the current filtered pool.")
-    pct_filters = st.session_state["discover_percentile_filters"]
-    pct_to_remove = None
-    for i, rule in enumerate(pct_filters):
+    pct_filters = [_with_uid(r) for r in st.session_state["discover_percentile_filters"]]
+    st.session_state["discover_percentile_filters"] = pct_filters
+    for rule in pct_filters:
+        uid = rule["uid"]
         c1, c2, c3, c4 = st.columns([2, 1, 1, 0.4])
         with c1:
             _pct_idx = pct_stat_options.index(rule["stat"]) if rule.get("stat") in pct_stat_options else 0
-            st.selectbox("Stat", options=pct_stat_options, key=f"pct_filter_stat_{i}", label_visibility="collapsed", index=_pct_idx)
+            st.selectbox("Stat", options=pct_stat_options, key=f"pct_filter_stat_{uid}", label_visibility="collapsed", index=_pct_idx, on_change=_sync_pct_rule, args=(uid,))
         with c2:
-            st.number_input("Min %ile", 0, 100, value=int(rule["min_pct"]) if rule.get("min_pct") is not None else 0, key=f"pct_filter_min_{i}", label_visibility="collapsed")
+            st.number_input("Min %ile", 0, 100, value=int(rule["min_pct"]) if rule.get("min_pct") is not None else 0, key=f"pct_filter_min_{uid}", label_visibility="collapsed", on_change=_sync_pct_rule, args=(uid,))
         with c3:
-            st.number_input("Max %ile", 0, 100, value=int(rule["max_pct"]) if rule.get("max_pct") is not None else 100, key=f"pct_filter_max_{i}", label_visibility="collapsed")
+            st.number_input("Max %ile", 0, 100, value=int(rule["max_pct"]) if rule.get("max_pct") is not None else 100, key=f"pct_filter_max_{uid}", label_visibility="collapsed", on_change=_sync_pct_rule, args=(uid,))
         with c4:
-            if st.button("🗑️", key=f"pct_filter_remove_{i}"):
-                pct_to_remove = i
-    if pct_to_remove is not None:
-        pct_filters.pop(pct_to_remove)
-        st.session_state["discover_percentile_filters"] = pct_filters
-        st.rerun()
-    _pct_rebuilt = []
-    for i in range(len(pct_filters)):
-        s = st.session_state.get(f"pct_filter_stat_{i}")
-        mi = st.session_state.get(f"pct_filter_min_{i}")
-        ma = st.session_state.get(f"pct_filter_max_{i}")
-        if s is not None:
-            _pct_rebuilt.append({"stat": s, "min_pct": mi, "max_pct": ma})
-    st.session_state["discover_percentile_filters"] = _pct_rebuilt
-    if st.button("➕ Add percentile filter", key="add_pct_filter"):
-        st.session_state["discover_percentile_filters"] = _pct_rebuilt + [{"stat": "avg_rating", "min_pct": 0, "max_pct": 100}]
-        st.rerun()
+            st.button("🗑️", key=f"pct_filter_remove_{uid}", on_click=_remove_rule, args=("discover_percentile_filters", uid))
+    st.button(
+        "➕ Add percentile filter", key="add_pct_filter",
+        on_click=_add_rule, args=("discover_percentile_filters", {"stat": "avg_rating", "min_pct": 0, "max_pct": 100}),
+    )
 
 st.markdown("</div>", unsafe_allow_html=True)  # close discover-filter-card
 
@@ -464,19 +581,18 @@ config = dict(config)
 config["stat_filters"] = st.session_state["discover_stat_filters"]
 config["percentile_filters"] = st.session_state["discover_percentile_filters"]
 
+def _freeze(o):
+    """Canonical hashable form of a config value: dicts become sorted (key, value) tuples, lists tuples."""
+    if isinstance(o, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in o.items()))
+    if isinstance(o, (list, tuple)):
+        return tuple(_freeze(x) for x in o)
+    return o
+
+
 # Cache key uses only panel filters (stat filters applied post-aggregation)
 _panel_only = {k: v for k, v in config.items() if k not in ("stat_filters", "percentile_filters")}
-_config_key = json.dumps(_panel_only, sort_keys=True)
-
-# Per90 and ratio columns from 03_player_season_stats / enriched (weighted avg by total_minutes)
-AGG_PER90_AND_RATIOS = [
-    "expectedGoals_per90", "expectedAssists_per90", "keyPass_per90", "totalTackle_per90",
-    "duelWon_per90", "interceptionWon_per90", "ballRecovery_per90", "totalShots_per90",
-    "onTargetScoringAttempt_per90", "touches_per90", "aerialWon_per90", "totalPass_per90",
-    "pass_accuracy", "pass_accuracy_pct", "duel_win_rate", "aerial_win_rate", "tackle_success_rate",
-    "bigChanceCreated_per90", "blockedScoringAttempt_per90", "totalClearance_per90",
-    "saves_per90", "goodHighClaim_per90", "savedShotsFromInsideTheBox_per90",
-]
+_config_key = _freeze(_panel_only)
 
 def aggregate_one_row_per_player(df: pd.DataFrame) -> pd.DataFrame:
     """One row per (player_id, season): primary row from max-minutes, sums, weighted avgs for rating and all per90/ratios."""
@@ -485,39 +601,86 @@ def aggregate_one_row_per_player(df: pd.DataFrame) -> pd.DataFrame:
     group_cols = ["player_id", "season"]
     if "season" not in df.columns:
         group_cols = ["player_id"]
-    idx_primary = df.groupby(group_cols)["total_minutes"].idxmax()
     primary_cols = ["player_id", "season", "player_name", "player_position", "team", "league_name", "age_at_season_start"]
-    primary = df.loc[idx_primary, [c for c in primary_cols if c in df.columns]].set_index(group_cols)
+    # Primary row = most minutes per group; a stable sort keeps idxmax's first-on-tie choice
+    primary = (
+        df[[c for c in primary_cols if c in df.columns] + ["total_minutes"]]
+        .dropna(subset=group_cols)
+        .sort_values("total_minutes", ascending=False, kind="stable")
+        .drop_duplicates(group_cols)
+        .drop(columns="total_minutes")
+        .set_index(group_cols)
+        .sort_index()
+    )
     sum_cols = [c for c in ["appearances", "total_minutes", "goals", "assists"] if c in df.columns]
-    sums = df.groupby(group_cols)[sum_cols].sum()
-    out = primary.join(sums, how="left")
-    # Weighted average rating
-    if "avg_rating" in df.columns and "total_minutes" in df.columns:
-        r = df.assign(_w=df["avg_rating"] * df["total_minutes"]).groupby(group_cols).agg(_sum_w=("_w", "sum"), _mins=("total_minutes", "sum"))
-        out = out.join((r["_sum_w"] / r["_mins"].replace(0, np.nan)).to_frame(name="avg_rating"), how="left")
+    # Minute-weighted columns: rating plus every per90/ratio present
+    w_cols = [c for c in ["avg_rating", *AGG_PER90_AND_RATIOS] if c in df.columns] if "total_minutes" in df.columns else []
+    parts = [df[group_cols + sum_cols]]
+    if w_cols:
+        # All weighted numerators in one broadcast multiply (NaN values are skipped by the sum, i.e. count as 0)
+        mins_arr = df["total_minutes"].to_numpy(dtype=float, na_value=np.nan)
+        weighted = df[w_cols].to_numpy(dtype=float, na_value=np.nan) * mins_arr[:, None]
+        parts.append(pd.DataFrame(weighted, index=df.index, columns=[f"_w_{c}" for c in w_cols]))
+    # One groupby-sum for the totals and all weighted numerators
+    totals = pd.concat(parts, axis=1).groupby(group_cols, observed=True).sum()
+    out = primary.join(totals[sum_cols], how="left")
+    wavg = None
+    if w_cols:
+        wavg = totals[[f"_w_{c}" for c in w_cols]].div(totals["total_minutes"].replace(0, np.nan), axis=0)
+        wavg.columns = w_cols
+    if wavg is not None and "avg_rating" in w_cols:
+        out = out.join(wavg[["avg_rating"]], how="left")
     # Goals per 90 from totals
     if "total_minutes" in out.columns and "goals" in out.columns:
         mins = out["total_minutes"].astype(float).replace(0, np.nan)
         out["goals_per90"] = 90 * out["goals"] / mins
-    # Weighted average for all per90 and ratio columns that exist
-    for col in AGG_PER90_AND_RATIOS:
-        if col not in df.columns or "total_minutes" not in df.columns:
-            continue
-        tmp = df.assign(_w=df[col].fillna(0) * df["total_minutes"]).groupby(group_cols).agg(_wx=("_w", "sum"), _mins=("total_minutes", "sum"))
-        out[col] = tmp["_wx"] / tmp["_mins"].replace(0, np.nan)
+    if wavg is not None:
+        for col in w_cols:
+            if col != "avg_rating":
+                out[col] = wavg[col]
     out = out.reset_index()
     return out
 
 
+# Every column aggregate_one_row_per_player reads; all of them feed the cache key
+_AGG_INPUT_COLS = (
+    "player_id", "season", "player_name", "player_position", "team", "league_name", "age_at_season_start",
+    "appearances", "total_minutes", "goals", "assists", "avg_rating", *AGG_PER90_AND_RATIOS,
+)
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> tuple:
+    """O(rows) cache key for a filtered slice of df_all: its row labels, columns and every aggregated value.
+
+    Hashing the values (not just the rows) means a loader refresh that changes stats on the
+    same rows misses the cache instead of serving stale aggregates.
+    """
+    read_cols = [c for c in _AGG_INPUT_COLS if c in df.columns]
+    return (len(df), tuple(df.columns), int(pd.util.hash_pandas_object(df[read_cols], index=True).sum()))
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=32, hash_funcs={pd.DataFrame: _frame_fingerprint})
+def _aggregate_cached(df_filtered: pd.DataFrame) -> pd.DataFrame:
+    """aggregate_one_row_per_player, reused when different panel configs land on the same rows."""
+    return aggregate_one_row_per_player(df_filtered)
+
+
 @st.cache_data(ttl=3600)
-def _cached_filter_aggregate_percentiles(_df_all: pd.DataFrame, config_key: str) -> tuple:
-    """Return (df_filtered, df_agg) keyed by config_key to avoid recomputing percentiles every run."""
-    if config_key == "__default__":
+def _cached_filter_aggregate_percentiles(_df_all: pd.DataFrame, config_key: tuple, _config: Optional[dict] = None) -> tuple:
+    """Return (df_filtered, df_agg) keyed by config_key to avoid recomputing percentiles every run.
+
+    config_key is the frozen form of _config (which is not hashed); without a config the default scope is used.
+    """
+    if _config is None:
         df_filtered = filter_to_default_scope(_df_all)
     else:
-        config = json.loads(config_key)
-        df_filtered = apply_filters(_df_all, config)
-    df_agg = aggregate_one_row_per_player(df_filtered)
+        config = _config
+        # Narrow to the indexed season/league/position scope first; apply_filters then only
+        # handles minutes/age/team/rating (re-checking scope on the small slice is cheap)
+        seasons = [s for s in (config.get("seasons") or []) if s != "All"] or [CURRENT_SEASON]
+        scoped = _scope_rows(_df_all, seasons, config.get("leagues"), config.get("positions"))
+        df_filtered = apply_filters(_df_all if scoped is None else scoped, config)
+    df_agg = _aggregate_cached(df_filtered)
     if not df_agg.empty and "player_position" in df_agg.columns:
         pct_group = ["season", "player_position"] if "season" in df_agg.columns else ["player_position"]
         pct_stats = [
@@ -535,32 +698,58 @@ def _cached_filter_aggregate_percentiles(_df_all: pd.DataFrame, config_key: str)
     return (df_filtered, df_agg)
 
 
-(df_filtered, df_agg) = _cached_filter_aggregate_percentiles(df_all, _config_key)
+(df_filtered, df_agg) = _cached_filter_aggregate_percentiles(df_all, _config_key, _panel_only)
 
 # Apply stat filters (raw values, then percentiles) on aggregated table
 def apply_stat_filters(df: pd.DataFrame, raw_filters: list, pct_filters: list) -> pd.DataFrame:
-    """Apply raw and percentile stat filters to aggregated dataframe. Handles missing keys in rules via .get()."""
-    out = df
+    """Apply raw and percentile stat filters to aggregated dataframe. Handles missing keys in rules via .get().
+
+    All rules are ANDed into one boolean mask and the frame is sliced once. With numexpr
+    installed the whole predicate is evaluated in a single pass; otherwise with numpy.
+    """
+    # (column, lower, upper) bounds; NaN values fail any bound (NaN comparisons are False)
+    bounds = []
     for rule in raw_filters:
         stat = rule.get("stat")
-        if not stat or stat not in out.columns:
+        if not stat or stat not in df.columns:
             continue
         min_val, max_val = rule.get("min"), rule.get("max")
-        if min_val is not None:
-            out = out[out[stat].fillna(-np.inf) >= min_val]
-        if max_val is not None:
-            out = out[out[stat].fillna(np.inf) <= max_val]
+        if min_val is not None or max_val is not None:
+            bounds.append((stat, min_val, max_val))
     for rule in pct_filters:
         stat = rule.get("stat")
         pct_col = f"{stat}_pct" if stat else None
-        if not pct_col or pct_col not in out.columns:
+        if not pct_col or pct_col not in df.columns:
             continue
         min_pct, max_pct = rule.get("min_pct"), rule.get("max_pct")
-        if min_pct is not None and min_pct > 0:
-            out = out[out[pct_col].fillna(-1) >= min_pct]
-        if max_pct is not None and max_pct < 100:
-            out = out[out[pct_col].fillna(101) <= max_pct]
-    return out
+        # 0 / 100 percentile bounds are treated as "no bound"
+        lo = min_pct if min_pct is not None and min_pct > 0 else None
+        hi = max_pct if max_pct is not None and max_pct < 100 else None
+        if lo is not None or hi is not None:
+            bounds.append((pct_col, lo, hi))
+    if not bounds:
+        return df
+    if numexpr is not None:
+        # Columns and bounds are bound as variables (c0, lo0, ...), so names and values need no escaping
+        env, terms = {}, []
+        for i, (col, lo, hi) in enumerate(bounds):
+            env[f"c{i}"] = df[col].to_numpy(dtype=float, na_value=np.nan)
+            if lo is not None:
+                env[f"lo{i}"] = float(lo)
+                terms.append(f"(c{i} >= lo{i})")
+            if hi is not None:
+                env[f"hi{i}"] = float(hi)
+                terms.append(f"(c{i} <= hi{i})")
+        mask = numexpr.evaluate(" & ".join(terms), local_dict=env)
+    else:
+        mask = np.ones(len(df), dtype=bool)
+        for col, lo, hi in bounds:
+            vals = df[col].to_numpy(dtype=float, na_value=np.nan)
+            if lo is not None:
+                mask &= vals >= lo
+            if hi is not None:
+                mask &= vals <= hi
+    return df.iloc[np.flatnonzero(mask)]
 
 stat_filters_applied = st.session_state.get("discover_stat_filters", []) or []
 percentile_filters_applied = st.session_state.get("discover_percentile_filters", []) or []
@@ -599,8 +788,8 @@ if df_agg.empty:
         "No players match the current filters. Loosen criteria or use **Reset to current season only** to see results."
     )
     if st.button("Reset to current season only", key="discover_empty_reset", type="primary"):
-        st.session_state["discover_seasons"] = [CURRENT_SEASON] if CURRENT_SEASON in df_all["season"].astype(str).unique() else []
-        avail = sorted(df_all["competition_slug"].unique())
+        st.session_state["discover_seasons"] = [CURRENT_SEASON] if CURRENT_SEASON in _avail_seasons() else []
+        avail = _avail_leagues()
         st.session_state["discover_leagues"] = [s for s in DEFAULT_COMPETITION_SLUGS if s in avail]
         st.session_state["discover_stat_filters"] = []
         st.session_state["discover_percentile_filters"] = []
@@ -644,7 +833,6 @@ COLUMN_TEMPLATES = {
 }
 template = st.session_state.discover_columns_template
 display_cols = [c for c in COLUMN_TEMPLATES.get(template, COLUMN_TEMPLATES["Default"]) if c in df_agg.columns]
-df_display = df_agg[display_cols].copy()
 
 # Rename for display (internal col name -> table header)
 rename_map = {
@@ -683,24 +871,33 @@ rename_map = {
     "goodHighClaim_per90": "Claims/90",
     "bigChanceCreated_per90": "BCC/90",
 }
-df_display = df_display.rename(columns={k: v for k, v in rename_map.items() if k in df_display.columns})
-
-# Numeric formatting
-for col in ["Rating", "G/90", "xG/90", "xA/90", "KP/90", "Tck/90", "Duels/90", "Int/90", "Rec/90", "Sh/90", "SoT/90", "Blk/90", "Clr/90", "Saves/90", "SavesBox/90", "Claims/90", "BCC/90", "Duel %", "Pass %"]:
-    if col in df_display.columns:
-        df_display[col] = df_display[col].round(2)
-for col in ["Rating %ile", "xG/90 %ile", "xA/90 %ile", "KP/90 %ile", "Tck/90 %ile"]:
-    if col in df_display.columns:
-        df_display[col] = df_display[col].round(0).fillna(0)
-for col in ["Apps", "Mins", "Goals", "Assists"]:
-    if col in df_display.columns:
-        df_display[col] = df_display[col].fillna(0).astype(int)
-if "Age" in df_display.columns:
-    df_display["Age"] = df_display["Age"].fillna(0).round(0).astype(int)
-
-# Position names
-if "Pos" in df_display.columns:
-    df_display["Pos"] = df_display["Pos"].map(POSITION_NAMES).fillna(df_display["Pos"])
+display_names = [rename_map.get(c, c) for c in display_cols]
+_raw_col = dict(zip(display_names, display_cols))
+
+
+def _format_display(frame: pd.DataFrame) -> pd.DataFrame:
+    """Rename to table headers and apply numeric / position formatting.
+
+    Only run on the rows actually shown or exported, never on the whole filtered set per rerun.
+    """
+    out = frame.rename(columns={k: v for k, v in rename_map.items() if k in frame.columns})
+    for col in ["Rating", "G/90", "xG/90", "xA/90", "KP/90", "Tck/90", "Duels/90", "Int/90", "Rec/90", "Sh/90", "SoT/90", "Blk/90", "Clr/90", "Saves/90", "SavesBox/90", "Claims/90", "BCC/90", "Duel %", "Pass %"]:
+        if col in out.columns:
+            out[col] = out[col].round(2)
+    for col in ["Rating %ile", "xG/90 %ile", "xA/90 %ile", "KP/90 %ile", "Tck/90 %ile"]:
+        if col in out.columns:
+            out[col] = out[col].round(0).fillna(0)
+    for col in ["Apps", "Mins", "Goals", "Assists"]:
+        if col in out.columns:
+            out[col] = out[col].fillna(0).astype(int)
+    if "Age" in out.columns:
+        out["Age"] = out["Age"].fillna(0).round(0).astype(int)
+    # Position names
+    if "Pos" in out.columns:
+        _pos = out["Pos"].astype(object)
+        out["Pos"] = _pos.map(POSITION_NAMES).fillna(_pos)
+    return out
+
 
 # ---------------------------------------------------------------------------
 # Results — column template, sort (full data), and data table
@@ -719,14 +916,14 @@ if col_template != st.session_state.discover_columns_template:
     st.rerun()
 
 # Sort by: apply to full dataset so pagination shows globally sorted rows
-sortable_cols = list(df_display.columns)
+sortable_cols = list(display_names)
 if "discover_sort_column" not in st.session_state:
-    st.session_state["discover_sort_column"] = "Rating" if "Rating" in df_display.columns else (sortable_cols[0] if sortable_cols else None)
+    st.session_state["discover_sort_column"] = "Rating" if "Rating" in sortable_cols else (sortable_cols[0] if sortable_cols else None)
 if "discover_sort_ascending" not in st.session_state:
     st.session_state["discover_sort_ascending"] = False
 _sort_col = st.session_state["discover_sort_column"]
-if _sort_col not in df_display.columns:
-    _sort_col = "Rating" if "Rating" in df_display.columns else sortable_cols[0]
+if _sort_col not in sortable_cols:
+    _sort_col = "Rating" if "Rating" in sortable_cols else sortable_cols[0]
     st.session_state["discover_sort_column"] = _sort_col
 
 _sort_c1, _sort_c2 = st.columns([1, 3])
@@ -745,15 +942,18 @@ if new_sort_col != st.session_state["discover_sort_column"] or new_sort_asc != s
     st.session_state["discover_table_page"] = 0
     st.rerun()
 
-# Sort full data then paginate (so "order" is on whole data, not current page)
+# Sort full data then paginate (so "order" is on whole data, not current page). Only the
+# sort column is formatted for the key, so the order matches the displayed values.
+_sort_by = st.session_state["discover_sort_column"]
 try:
-    df_sorted = df_display.sort_values(
-        by=st.session_state["discover_sort_column"],
+    _sort_key = _format_display(df_agg[[_raw_col[_sort_by]]])[_sort_by].reset_index(drop=True)
+    sort_order = _sort_key.sort_values(
         ascending=st.session_state["discover_sort_ascending"],
         na_position="last",
-    ).reset_index(drop=True)
+        kind="stable",
+    ).index.to_numpy()
 except Exception:
-    df_sorted = df_display
+    sort_order = np.arange(len(df_agg))
 
 # Pagination: one page = one screenful (no scrolling inside the table)
 DISCOVER_PAGE_SIZE = 20  # rows per page so table fits without vertical scroll
@@ -761,13 +961,13 @@ ROW_HEIGHT_PX = 36
 TABLE_HEADER_PX = 44
 if "discover_table_page" not in st.session_state:
     st.session_state["discover_table_page"] = 0
-total_rows = len(df_sorted)
+total_rows = len(sort_order)
 total_pages = max(1, (total_rows + DISCOVER_PAGE_SIZE - 1) // DISCOVER_PAGE_SIZE)
 current_page = max(0, min(st.session_state["discover_table_page"], total_pages - 1))
 st.session_state["discover_table_page"] = current_page
 start_idx = current_page * DISCOVER_PAGE_SIZE
 end_idx = min(start_idx + DISCOVER_PAGE_SIZE, total_rows)
-df_page = df_sorted.iloc[start_idx:end_idx].reset_index(drop=True)
+df_page = _format_display(df_agg[display_cols].iloc[sort_order[start_idx:end_idx]]).reset_index(drop=True)
 table_height = TABLE_HEADER_PX + min(len(df_page), DISCOVER_PAGE_SIZE) * ROW_HEIGHT_PX
 st.dataframe(df_page, use_container_width=True, height=table_height, hide_index=True)
 if total_rows > DISCOVER_PAGE_SIZE:
@@ -786,7 +986,7 @@ if total_rows > DISCOVER_PAGE_SIZE:
 # Export CSV and share link (export uses same sort order as table)
 ex1, ex2 = st.columns(2)
 with ex1:
-    csv_full = df_sorted.to_csv(index=False)
+    csv_full = _format_display(df_agg[display_cols].iloc[sort_order]).to_csv(index=False)
     st.download_button(
         "⬇️ Export full filtered table (CSV)",
         data=csv_full,
@@ -884,7 +1084,7 @@ st.markdown(
 # Quick league breakdown (by primary league in aggregated table)
 st.markdown("<div style='margin-top:10px;'></div>", unsafe_allow_html=True)
 if "league_name" in df_agg.columns:
-    league_counts = df_agg.groupby("league_name")["player_id"].nunique().sort_values(ascending=False)
+    league_counts = df_agg.groupby("league_name", observed=True)["player_id"].nunique().sort_values(ascending=False)
     league_cols = st.columns(min(len(league_counts), 4))
     for i, (league, count) in enumerate(league_counts.head(4).items()):
         with league_cols[i]:
@@ -78,6 +78,7 @@ def get_filtered_teams_tactics(
 from dashboard.utils.constants import (
     COMP_NAMES, COMP_FLAGS, TACTICAL_INDEX_LABELS, LEAGUE_SLUGS,
 )
+from dashboard.utils.filters import comp_label_map
 from dashboard.tactics.components.tactical_components import (
     TACTICAL_RADAR_INDICES,
     normalize_tactical_radar_to_100,
@@ -149,7 +150,7 @@ with a:
         "League",
         options=all_comps,
         default=st.session_state.get("dir_league", default_leagues),
-        format_func=lambda x: f"{COMP_FLAGS.get(x, '')} {COMP_NAMES.get(x, x)}",
+        format_func=comp_label_map(tuple(all_comps), default_flag="").get,
         key="dir_league",
     )
 with b:
@@ -382,9 +383,9 @@ else:
                     comp_labels += " …"
                 goals_for = int(team.get("goals_for", 0))
                 goals_against = int(team.get("goals_against", 0))
-                wdl = get_team_wdl(team_name, season, first_comp) if first_comp else {}
+                wdl = get_team_wdl(team_name, str(season), first_comp) if first_comp else {}
                 wdl_str = f"{wdl.get('W', 0)}-{wdl.get('D', 0)}-{wdl.get('L', 0)}" if wdl else "—"
-                form_info = get_team_form(team_name, season, first_comp, n=5) if first_comp else {}
+                form_info = get_team_form(team_name, str(season), first_comp, n=5) if first_comp else {}
                 form_str = form_info.get("form_string", "") if isinstance(form_info, dict) else (form_info[0] if isinstance(form_info, tuple) else "")
                 # Get tactical mini-radar: use all competitions (aggregated) when team has multiple, so it matches Profile "All"
                 tac_data = None
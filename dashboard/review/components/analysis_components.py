@@ -518,6 +518,8 @@ def render_post_match_report(
             ("Fouls", 'fouls', ""),
         ]
 
+        # One three-column grid for all stats: a single st.markdown instead of three per stat
+        stat_rows = []
         for stat_name, stat_key, suffix in stats_to_compare:
             home_val = home_stats.get(stat_key, 0) if hasattr(home_stats, 'get') else 0
             away_val = away_stats.get(stat_key, 0) if hasattr(away_stats, 'get') else 0
@@ -525,29 +527,26 @@ def render_post_match_report(
 
             if total > 0:
                 home_pct = (home_val / total) * 100
-
-                cols = st.columns([1, 1, 1])
-                with cols[0]:
-                    st.markdown(f"<div style='text-align: right; font-weight: 600; color: #C9A840;'>{home_val}{suffix}</div>", unsafe_allow_html=True)
-                with cols[1]:
-                    st.markdown(
-                        f"""
-                        <div style="text-align: center; font-size: 0.75rem; color: #8B949E;">{stat_name}</div>
-                        <div style="display: flex; height: 8px; border-radius: 4px; overflow: hidden; margin-top: 4px;">
-                            <div style="width: {home_pct}%; background: #C9A840;"></div>
-                            <div style="width: {100-home_pct}%; background: #58A6FF;"></div>
-                        </div>
-                        """,
-                        unsafe_allow_html=True
-                    )
-                with cols[2]:
-                    st.markdown(f"<div style='text-align: left; font-weight: 600; color: #58A6FF;'>{away_val}{suffix}</div>", unsafe_allow_html=True)
+                stat_rows.append(
+                    f"<div style='text-align: right; font-weight: 600; color: #C9A840;'>{home_val}{suffix}</div>"
+                    f"<div><div style='text-align: center; font-size: 0.75rem; color: #8B949E;'>{stat_name}</div>"
+                    f"<div style='display: flex; height: 8px; border-radius: 4px; overflow: hidden; margin-top: 4px;'>"
+                    f"<div style='width: {home_pct}%; background: #C9A840;'></div>"
+                    f"<div style='width: {100-home_pct}%; background: #58A6FF;'></div></div></div>"
+                    f"<div style='text-align: left; font-weight: 600; color: #58A6FF;'>{away_val}{suffix}</div>"
+                )
+        if stat_rows:
+            st.markdown(
+                "<div style='display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 8px 16px; align-items: center;'>"
+                + "".join(stat_rows) + "</div>",
+                unsafe_allow_html=True
+            )
 
         # Key moments
         st.markdown("---")
         st.markdown("**Key Moments**")
-        for moment in key_moments:
-            st.markdown(f"• {moment}")
+        if key_moments:
+            st.markdown("\n\n".join(f"• {moment}" for moment in key_moments))
 
         # Tactical analysis
         st.markdown("---")
@@ -9,13 +9,83 @@ This module provides:
 
 import io
 import csv
-from datetime import datetime, timedelta
+import itertools
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 import calendar
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from dashboard.utils.constants import COMP_FLAGS, COMP_NAMES
+from dashboard.review.schedule_priorities import IMPORTANCE_LEVELS
+
+# Calendar cell fragments. Kept on one line each so markdown does not treat
+# indented HTML as a code block.
+_CELL_HEADER_TPL = (
+    "<div style='border: 2px solid {border_color}; border-radius: 8px; padding: 8px; "
+    "min-height: 100px; background: {bg_color}; opacity: {opacity};'>"
+    "<div style='font-weight: bold; margin-bottom: 4px; color: #F0F6FC;'>{day}</div>"
+)
+_MATCH_TPL = (
+    "<div style='font-size: 9px; background: #0068c9; color: white; padding: 2px 4px; "
+    "border-radius: 3px; margin: 2px 0; white-space: nowrap; overflow: hidden; "
+    "text-overflow: ellipsis;'>{home} v {away}</div>"
+)
+_MORE_TPL = "<div style='font-size: 8px; color: #8B949E;'>+{extra} more</div>"
+
+# Form badges: W/D/L spans are built once; other characters fall back to grey
+_FORM_SPAN_TPL = (
+    "<span style='background: {color}; color: white; padding: 2px 6px; border-radius: 4px; "
+    "margin: 0 2px; font-size: 12px; font-weight: 600;'>{result}</span>"
+)
+_FORM_SPANS = {
+    result: _FORM_SPAN_TPL.format(color=color, result=result)
+    for result, color in (
+        ('W', '#28a745'),  # Green for win
+        ('D', '#ffc107'),  # Yellow for draw
+        ('L', '#dc3545'),  # Red for loss
+    )
+}
+
+# Shared read-only match list for calendar days without fixtures
+_EMPTY: list = []
+
+
+@st.cache_data(show_spinner=False)
+def parse_match_dates(matches_df: pd.DataFrame, date_col: str = "match_date_utc") -> pd.DataFrame:
+    """Return a copy of the schedule with the date column parsed to naive UTC timestamps.
+
+    Call once per page and pass the result to the render helpers so the
+    column is not re-parsed by every component on each rerun.
+
+    Args:
+        matches_df: DataFrame with match data
+        date_col: Column containing match dates
+
+    Returns:
+        DataFrame whose date column is tz-naive UTC datetime64 (tz-aware columns
+        are far slower to normalize, compare and convert); unparseable values are NaT
+    """
+    df = matches_df.copy()
+    df[date_col] = pd.to_datetime(df[date_col], errors='coerce', cache=True, utc=True).dt.tz_convert(None)
+    return df
+
+
+def _ensure_parsed_dates(matches_df: pd.DataFrame, date_col: str) -> pd.DataFrame:
+    """Parse date_col via parse_match_dates unless the caller already did."""
+    if date_col not in matches_df.columns:
+        return matches_df
+    dtype = matches_df[date_col].dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        # Already parsed; dropping the zone is a metadata change, not a re-parse
+        return matches_df.assign(**{date_col: matches_df[date_col].dt.tz_convert(None)})
+    if pd.api.types.is_datetime64_dtype(dtype):
+        return matches_df
+    return parse_match_dates(matches_df, date_col)
+
 
 def render_calendar_grid(
     matches_df: pd.DataFrame,
@@ -37,91 +107,100 @@ def render_calendar_grid(
         away_col: Column containing away team names
         on_match_click: Callback when match is clicked
     """
-    # Generate calendar weeks
-    current_date = start_date
+    st.subheader("📅 Match Calendar")
+    grid_html = _calendar_html(
+        matches_df, start_date, end_date, datetime.now().date(),
+        date_col=date_col, home_col=home_col, away_col=away_col,
+    )
+    st.markdown(grid_html, unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False, ttl=300)
+def _calendar_html(
+    matches_df: pd.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    today: date,
+    date_col: str = "match_date_utc",
+    home_col: str = "home_team_name",
+    away_col: str = "away_team_name",
+) -> str:
+    """Build the calendar grid HTML (cached; today is part of the key for highlighting).
+
+    Args:
+        matches_df: DataFrame with match data
+        start_date: Start date for calendar
+        end_date: End date for calendar
+        today: Date highlighted as today
+        date_col: Column containing match dates
+        home_col: Column containing home team names
+        away_col: Column containing away team names
+
+    Returns:
+        HTML string for the calendar grid
+    """
+    matches_df = _ensure_parsed_dates(matches_df, date_col)
+
+    # Group match records by calendar day once; days without matches share _EMPTY
+    records_by_date: Dict[Any, List[Dict[str, Any]]] = {}
+    if not matches_df.empty:
+        for match_day, match in zip(matches_df[date_col].dt.date, matches_df.to_dict('records')):
+            records_by_date.setdefault(match_day, []).append(match)
+
+    # Generate calendar weeks: Monday of the first week through Sunday of the last,
+    # as one (n_weeks, 7) array of days
+    week0 = pd.Timestamp(start_date).normalize() - timedelta(days=start_date.weekday())
+    week_end = pd.Timestamp(end_date).normalize() + timedelta(days=6 - end_date.weekday())
+    grid = pd.date_range(week0, week_end, freq='D').values.reshape(-1, 7)
     weeks = []
 
-    while current_date <= end_date:
-        week_start = current_date - timedelta(days=current_date.weekday())
+    for week_row in grid:
         week = []
-        for i in range(7):
-            day = week_start + timedelta(days=i)
-            day_matches = matches_df[
-                pd.to_datetime(matches_df[date_col]).dt.date == day.date()
-            ] if not matches_df.empty else pd.DataFrame()
-
+        for day64 in week_row:
+            day = pd.Timestamp(day64)
             week.append({
                 'date': day,
-                'matches': day_matches.to_dict('records') if not day_matches.empty else [],
+                'matches': records_by_date.get(day.date(), _EMPTY),
                 'is_current_month': day.month == start_date.month
             })
         weeks.append(week)
-        current_date = week_start + timedelta(days=7)
-
-    # Render calendar
-    st.subheader("📅 Match Calendar")
 
-    # Day headers
+    # Build calendar as a single CSS grid (no per-cell Streamlit containers)
     days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-    header_cols = st.columns(7)
-    for i, day in enumerate(days):
-        with header_cols[i]:
-            st.markdown(
-                f"<div style='text-align: center; font-weight: bold; color: #8B949E;'>{day}</div>",
-                unsafe_allow_html=True
-            )
+    # .cal-row/.cal-week grid and spacing come from inject_css (dashboard/utils/styles.py)
+    parts = ["<div class='cal-grid'><div class='cal-row'>"]
+    parts.extend(f"<div class='cal-header'>{day}</div>" for day in days)
+    parts.append("</div>")
 
-    # Calendar grid
     for week in weeks:
-        week_cols = st.columns(7)
-        for i, day_data in enumerate(week):
-            with week_cols[i]:
-                day = day_data['date']
-                matches = day_data['matches']
-                is_today = day.date() == datetime.now().date()
-
-                # Day cell styling
-                opacity = "1.0" if day_data['is_current_month'] else "0.4"
-                border_color = "#00D4AA" if is_today else "#30363D"
-                bg_color = "#161B22" if not is_today else "#0D3B2E"
-
-                cell_html = f"""
-                <div style="
-                    border: 2px solid {border_color};
-                    border-radius: 8px;
-                    padding: 8px;
-                    min-height: 100px;
-                    background: {bg_color};
-                    opacity: {opacity};
-                ">
-                    <div style="font-weight: bold; margin-bottom: 4px; color: #F0F6FC;">{day.day}</div>
-                """
-
-                # Match indicators
-                for match in matches[:3]:  # Show max 3 matches per cell
-                    home = match.get(home_col, 'TBD')[:3]
-                    away = match.get(away_col, 'TBD')[:3]
-                    cell_html += f"""
-                    <div style="
-                        font-size: 9px;
-                        background: #0068c9;
-                        color: white;
-                        padding: 2px 4px;
-                        border-radius: 3px;
-                        margin: 2px 0;
-                        white-space: nowrap;
-                        overflow: hidden;
-                        text-overflow: ellipsis;
-                    ">{home} v {away}</div>
-                    """
-
-                if len(matches) > 3:
-                    cell_html += f"<div style='font-size: 8px; color: #8B949E;'>+{len(matches)-3} more</div>"
-
-                cell_html += "</div>"
-                st.markdown(cell_html, unsafe_allow_html=True)
-
-        st.markdown("<div style='margin: 4px 0;'></div>", unsafe_allow_html=True)
+        parts.append("<div class='cal-week'>")
+        for day_data in week:
+            day = day_data['date']
+            matches = day_data['matches']
+            is_today = day.date() == today
+
+            # Day cell styling
+            parts.append(_CELL_HEADER_TPL.format(
+                border_color="#00D4AA" if is_today else "#30363D",
+                bg_color="#0D3B2E" if is_today else "#161B22",
+                opacity="1.0" if day_data['is_current_month'] else "0.4",
+                day=day.day,
+            ))
+
+            # Match indicators (max 3 per cell)
+            parts.extend(
+                _MATCH_TPL.format(home=match.get(home_col, 'TBD')[:3], away=match.get(away_col, 'TBD')[:3])
+                for match in matches[:3]
+            )
+            if len(matches) > 3:
+                parts.append(_MORE_TPL.format(extra=len(matches) - 3))
+
+            parts.append("</div>")
+
+        parts.append("</div>")
+
+    parts.append("</div>")
+    return "".join(parts)
 
 
 def render_match_list(
@@ -130,9 +209,11 @@ def render_match_list(
     home_col: str = "home_team_name",
     away_col: str = "away_team_name",
     show_form: bool = True,
-    on_analyze: Optional[callable] = None
+    on_analyze: Optional[callable] = None,
+    page_size: int = 10,
+    page_key: str = "sched_page"
 ) -> None:
-    """Render matches as a detailed list.
+    """Render matches as a detailed list, page_size match cards at a time.
 
     Args:
         matches_df: DataFrame with match data
@@ -141,15 +222,56 @@ def render_match_list(
         away_col: Column containing away team names
         show_form: Whether to show form indicators
         on_analyze: Callback for analyze button
+        page_size: Match cards per page (0 renders all)
+        page_key: Session state key holding the current page
     """
     if matches_df.empty:
         st.info("No matches to display")
         return
 
-    for date, day_matches in matches_df.groupby(pd.to_datetime(matches_df[date_col]).dt.date):
-        st.subheader(date.strftime("%A, %B %d, %Y"))
-
-        for _, match in day_matches.iterrows():
+    matches_df = _ensure_parsed_dates(matches_df, date_col)
+
+    # Resolve competition emoji/name for all rows in one vectorized pass
+    if 'competition_slug' in matches_df.columns:
+        slugs = matches_df['competition_slug']
+        matches_df = matches_df.assign(
+            _comp_emoji=slugs.map(COMP_FLAGS).fillna('🏆'),
+            _comp_name=slugs.map(COMP_NAMES).fillna(slugs),
+        )
+
+    now_utc = pd.Timestamp.now(tz='UTC')
+
+    # Walk match days in order with a stable sort instead of a hash groupby
+    day_values = matches_df[date_col].dt.normalize().to_numpy(dtype="datetime64[ns]")
+    order = np.flatnonzero(~np.isnat(day_values))
+    order = order[np.argsort(day_values[order], kind="stable")]
+
+    total_matches = len(order)
+    if page_size and total_matches > page_size:
+        total_pages = (total_matches + page_size - 1) // page_size
+        page = max(0, min(st.session_state.get(page_key, 0), total_pages - 1))
+        st.session_state[page_key] = page
+        start = page * page_size
+        end = min(start + page_size, total_matches)
+        order = order[start:end]
+
+        c1, c2, c3 = st.columns([1, 2, 1])
+        with c1:
+            if st.button("← Prev", key=f"{page_key}_prev", disabled=(page == 0)):
+                st.session_state[page_key] = page - 1
+                st.rerun()
+        with c2:
+            st.caption(f"**{start + 1}–{end}** of **{total_matches}** matches")
+        with c3:
+            if st.button("Next →", key=f"{page_key}_next", disabled=(page >= total_pages - 1)):
+                st.session_state[page_key] = page + 1
+                st.rerun()
+
+    for day, positions in itertools.groupby(order, key=day_values.__getitem__):
+        day_matches = matches_df.iloc[list(positions)]
+        st.subheader(pd.Timestamp(day).strftime("%A, %B %d, %Y"))
+
+        for match in day_matches.to_dict('records'):
             with st.container():
                 render_match_card(
                     match,
@@ -157,7 +279,8 @@ def render_match_list(
                     home_col=home_col,
                     away_col=away_col,
                     show_form=show_form,
-                    on_analyze=on_analyze
+                    on_analyze=on_analyze,
+                    now=now_utc
                 )
 
 
@@ -168,7 +291,8 @@ def render_match_card(
     away_col: str = "away_team_name",
     compact: bool = False,
     show_form: bool = True,
-    on_analyze: Optional[callable] = None
+    on_analyze: Optional[callable] = None,
+    now: Optional[pd.Timestamp] = None
 ) -> None:
     """Render a rich match card with form indicators.
 
@@ -180,18 +304,20 @@ def render_match_card(
         compact: Whether to render in compact mode
         show_form: Whether to show form indicators
         on_analyze: Callback for analyze button
+        now: Current UTC time; pass it when rendering many cards so it is computed once
     """
-    from dashboard.utils.constants import COMP_FLAGS, COMP_NAMES
-
     home = match.get(home_col, 'TBD')
     away = match.get(away_col, 'TBD')
     league = match.get('competition_slug', '')
     match_date = match.get(date_col)
+    if isinstance(match_date, str):
+        # Direct callers may pass raw strings; unparseable or blank dates become NaT ("TBC")
+        match_date = pd.to_datetime(match_date, errors='coerce')
     match_id = match.get('match_id', 0)
 
     # Get match time
     match_time = "TBC"
-    if match_date and hasattr(match_date, 'strftime'):
+    if pd.notna(match_date) and hasattr(match_date, 'strftime'):
         match_time = match_date.strftime("%H:%M")
 
     # Form indicators
@@ -200,82 +326,65 @@ def render_match_card(
 
     # Days until match
     days_until = 0
-    if match_date:
-        if isinstance(match_date, str):
-            match_date = pd.to_datetime(match_date)
-        # Use timezone-aware "now" when match_date is tz-aware to avoid subtraction error
-        now = pd.Timestamp.now(tz=match_date.tz) if getattr(match_date, "tz", None) is not None else datetime.now()
-        days_until = (match_date - now).days
+    if pd.notna(match_date):
+        if now is None:
+            now = pd.Timestamp.now(tz='UTC')
+        # Naive match dates are UTC (match_date_utc), so compare against naive UTC "now"
+        if match_date.tzinfo is not None:
+            days_until = (match_date - now).days
+        else:
+            days_until = (match_date - now.tz_convert(None)).days
 
     days_text = "TODAY" if days_until == 0 else "TOMORROW" if days_until == 1 else f"In {days_until} days"
     days_color = "#ff4b4b" if days_until <= 1 else "#8B949E"
 
+    comp_emoji = match.get('_comp_emoji') or COMP_FLAGS.get(league, '🏆')
+    comp_name = match.get('_comp_name') or COMP_NAMES.get(league, league)
+    matchday = match.get('matchday', 'N/A')
+    home_pos = match.get('home_position', '-')
+    away_pos = match.get('away_position', '-')
+
+    # Header, teams and stats carry no widgets, so they render as one HTML block
+    home_extra = ""
+    away_extra = ""
+    if show_form:
+        home_extra += f"<div><b>Form (last 5):</b> {render_form_indicator(home_form)}</div>"
+        away_extra += f"<div><b>Form (last 5):</b> {render_form_indicator(away_form)}</div>"
+    if home_pos != '-':
+        home_extra += f"<div style='font-size: 0.85rem; color: #8B949E;'>📊 Position: {home_pos}</div>"
+    if away_pos != '-':
+        away_extra += f"<div style='font-size: 0.85rem; color: #8B949E;'>📊 Position: {away_pos}</div>"
+
+    card_html = (
+        "<div style='background: #161B22; border: 1px solid #30363D; border-radius: 12px; "
+        "padding: 16px; margin-bottom: 12px;'>"
+        "<div style='display: flex; align-items: center; gap: 12px;'>"
+        f"<div style='font-size: 24px;'>{comp_emoji}</div>"
+        f"<div style='flex: 1; font-size: 0.85rem; color: #8B949E;'>{comp_name} • Matchday {matchday}</div>"
+        f"<div style='text-align: right;'>⏰ {match_time}</div>"
+        "</div>"
+        "<div style='display: flex; align-items: flex-start; margin-top: 12px;'>"
+        f"<div style='flex: 2;'><div style='font-size: 1.2rem; font-weight: 600;'>{home}</div>{home_extra}</div>"
+        "<div style='flex: 1; text-align: center;'>"
+        "<div style='font-size: 1.5rem; font-weight: bold; color: #8B949E;'>VS</div>"
+        f"<div style='color: {days_color}; font-size: 0.85rem; font-weight: 600;'>{days_text}</div>"
+        "</div>"
+        f"<div style='flex: 2; text-align: right;'><div style='font-size: 1.2rem; font-weight: 600;'>{away}</div>{away_extra}</div>"
+        "</div>"
+    )
+
+    # Stats comparison (if not compact)
+    if not compact:
+        stats_html = _stats_comparison_html(match)
+        if stats_html:
+            card_html += "<hr style='border-color: #30363D; margin: 12px 0;'>" + stats_html
+
+    card_html += "</div>"
+
     with st.container():
-        # Card container
-        st.markdown("""
-            <div style="
-                background: #161B22;
-                border: 1px solid #30363D;
-                border-radius: 12px;
-                padding: 16px;
-                margin-bottom: 12px;
-            ">
-        """, unsafe_allow_html=True)
-
-        # Header with competition and time
-        header_cols = st.columns([1, 3, 1])
-
-        with header_cols[0]:
-            comp_emoji = COMP_FLAGS.get(league, '🏆')
-            st.markdown(f"<div style='font-size: 24px;'>{comp_emoji}</div>", unsafe_allow_html=True)
-
-        with header_cols[1]:
-            matchday = match.get('matchday', 'N/A')
-            st.caption(f"{COMP_NAMES.get(league, league)} • Matchday {matchday}")
-
-        with header_cols[2]:
-            st.markdown(f"<div style='text-align: right;'>⏰ {match_time}</div>", unsafe_allow_html=True)
-
-        # Teams section
-        teams_cols = st.columns([2, 1, 2])
-
-        with teams_cols[0]:
-            st.markdown(f"<div style='font-size: 1.2rem; font-weight: 600;'>{home}</div>", unsafe_allow_html=True)
-
-            if show_form:
-                form_html = render_form_indicator(home_form)
-                st.markdown(f"**Form (last 5):** {form_html}", unsafe_allow_html=True)
-
-            home_pos = match.get('home_position', '-')
-            if home_pos != '-':
-                st.caption(f"📊 Position: {home_pos}")
-
-        with teams_cols[1]:
-            st.markdown(f"""
-                <div style="text-align: center;">
-                    <div style="font-size: 1.5rem; font-weight: bold; color: #8B949E;">VS</div>
-                    <div style="color: {days_color}; font-size: 0.85rem; font-weight: 600;">{days_text}</div>
-                </div>
-            """, unsafe_allow_html=True)
-
-        with teams_cols[2]:
-            st.markdown(f"<div style='font-size: 1.2rem; font-weight: 600; text-align: right;'>{away}</div>", unsafe_allow_html=True)
-
-            if show_form:
-                form_html = render_form_indicator(away_form)
-                st.markdown(f"<div style='text-align: right;'><b>Form (last 5):</b> {form_html}</div>", unsafe_allow_html=True)
-
-            away_pos = match.get('away_position', '-')
-            if away_pos != '-':
-                st.caption(f"📊 Position: {away_pos}")
-
-        # Stats comparison (if not compact)
-        if not compact:
-            st.divider()
-            render_stats_comparison(match)
-
-        # Action buttons
-        st.divider()
+        st.markdown(card_html, unsafe_allow_html=True)
+
+        # Action buttons are the only widgets, grouped in a single column row
         action_cols = st.columns(3)
 
         with action_cols[0]:
@@ -291,9 +400,70 @@ def render_match_card(
             if st.button("🔔 Remind", key=f"remind_{match_id}", use_container_width=True):
                 pass  # Placeholder for reminder
 
-        st.markdown("</div>", unsafe_allow_html=True)
 
+def render_priorities_editor(
+    matches_df: pd.DataFrame,
+    priorities: Dict[str, Dict[str, Any]],
+    date_col: str = "match_date_utc",
+    home_col: str = "home_team_name",
+    away_col: str = "away_team_name",
+    key: str = "schedule_priorities_editor"
+) -> Dict[str, Dict[str, Any]]:
+    """Edit To scout / importance for every match in a single data editor.
+
+    One widget covers all rows, instead of a checkbox and a selectbox per match.
+
+    Args:
+        matches_df: DataFrame with match data (requires match_id)
+        priorities: match_id -> {to_scout, importance}, as from load_schedule_priorities()
+        date_col: Column containing match dates
+        home_col: Column containing home team names
+        away_col: Column containing away team names
+        key: Widget key for the editor
+
+    Returns:
+        Copy of priorities updated with the edited rows; pass to save_schedule_priorities()
+    """
+    if matches_df.empty or 'match_id' not in matches_df.columns:
+        return priorities
 
+    matches_df = _ensure_parsed_dates(matches_df, date_col)
+    match_ids = matches_df['match_id'].astype(str).to_numpy()
+    if date_col in matches_df.columns:
+        dates = matches_df[date_col].dt.strftime('%Y-%m-%d').fillna('TBC')
+    else:
+        dates = pd.Series('TBC', index=matches_df.index)
+    labels = dates + ' · ' + matches_df[home_col].astype(str) + ' vs ' + matches_df[away_col].astype(str)
+    current = [priorities.get(mid, {}) for mid in match_ids]
+
+    edited = st.data_editor(
+        pd.DataFrame({
+            'match_id': match_ids,
+            'match': labels.to_numpy(),
+            'to_scout': [bool(p.get('to_scout', False)) for p in current],
+            'importance': [p.get('importance', 'Medium') for p in current],
+        }),
+        column_config={
+            'match_id': None,
+            'match': st.column_config.TextColumn("Match"),
+            'to_scout': st.column_config.CheckboxColumn("To scout"),
+            'importance': st.column_config.SelectboxColumn(
+                "Importance", options=list(IMPORTANCE_LEVELS), required=True
+            ),
+        },
+        disabled=['match'],
+        hide_index=True,
+        use_container_width=True,
+        key=key,
+    )
+
+    updated = dict(priorities)
+    for mid, to_scout, importance in zip(edited['match_id'], edited['to_scout'], edited['importance']):
+        updated[mid] = {'to_scout': bool(to_scout), 'importance': importance}
+    return updated
+
+
+@lru_cache(maxsize=256)
 def render_form_indicator(form_string: str) -> str:
     """Render form indicator HTML from form string (e.g., 'WWDLW').
 
@@ -303,144 +473,189 @@ def render_form_indicator(form_string: str) -> str:
     Returns:
         HTML string for form indicator
     """
-    colors = {
-        'W': '#28a745',  # Green for win
-        'D': '#ffc107',  # Yellow for draw
-        'L': '#dc3545',  # Red for loss
-    }
-
-    form_html = ""
-    for result in form_string.upper():
-        color = colors.get(result, '#6c757d')
-        form_html += f"""
-            <span style="
-                background: {color};
-                color: white;
-                padding: 2px 6px;
-                border-radius: 4px;
-                margin: 0 2px;
-                font-size: 12px;
-                font-weight: 600;
-            ">{result}</span>
-        """
-
-    return form_html
+    return "".join(
+        _FORM_SPANS.get(result) or _FORM_SPAN_TPL.format(color='#6c757d', result=result)
+        for result in form_string.upper()
+    )
 
 
-def render_stats_comparison(match: Dict[str, Any]) -> None:
-    """Render visual stat comparison between teams.
+def _stats_comparison_html(match: Dict[str, Any]) -> str:
+    """Build the stat comparison bars as a single flex row of HTML.
 
     Args:
         match: Match data dictionary
+
+    Returns:
+        HTML string for the stat comparison, or "" when every stat is zero
+        (typical for future fixtures)
     """
-    # Get stats
     comparisons = [
         ('PPG', match.get('home_ppg', 0), match.get('away_ppg', 0)),
         ('xG', match.get('home_xg', 0), match.get('away_xg', 0)),
         ('Goals', match.get('home_goals', 0), match.get('away_goals', 0)),
         ('Clean Sheets', match.get('home_cs', 0), match.get('away_cs', 0)),
     ]
+    if not any((home_val or 0) + (away_val or 0) for _, home_val, away_val in comparisons):
+        return ""
+
+    stats_html = "<div style='display: flex; gap: 16px;'>"
+    for label, home_val, away_val in comparisons:
+        stats_html += f"<div style='flex: 1;'><div style='font-weight: 600; margin-bottom: 4px;'>{label}</div>"
+
+        # Visual comparison bar
+        total = home_val + away_val
+        if total > 0:
+            home_pct = (home_val / total) * 100
+            stats_html += (
+                "<div style='display: flex; height: 20px; border-radius: 4px; overflow: hidden; font-size: 11px;'>"
+                f"<div style='width: {home_pct}%; background: #0068c9; display: flex; align-items: center; "
+                f"justify-content: center; color: white;'>{home_val:.1f}</div>"
+                f"<div style='width: {100-home_pct}%; background: #ff9500; display: flex; align-items: center; "
+                f"justify-content: center; color: white;'>{away_val:.1f}</div>"
+                "</div>"
+            )
+        stats_html += "</div>"
+    stats_html += "</div>"
 
-    stats_cols = st.columns(len(comparisons))
-
-    for col, (label, home_val, away_val) in zip(stats_cols, comparisons):
-        with col:
-            st.write(f"**{label}**")
-
-            # Visual comparison bar
-            total = home_val + away_val
-            if total > 0:
-                home_pct = (home_val / total) * 100
-                bar_html = f"""
-                    <div style="
-                        display: flex;
-                        height: 20px;
-                        border-radius: 4px;
-                        overflow: hidden;
-                        font-size: 11px;
-                    ">
-                        <div style="
-                            width: {home_pct}%;
-                            background: #0068c9;
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-                            color: white;
-                        ">{home_val:.1f}</div>
-                        <div style="
-                            width: {100-home_pct}%;
-                            background: #ff9500;
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-                            color: white;
-                        ">{away_val:.1f}</div>
-                    </div>
-                """
-                st.markdown(bar_html, unsafe_allow_html=True)
+    return stats_html
 
 
-def generate_ical_event(match: Dict[str, Any]) -> str:
-    """Generate iCal (.ics) format for a match.
+def render_stats_comparison(match: Dict[str, Any]) -> None:
+    """Render visual stat comparison between teams.
 
     Args:
         match: Match data dictionary
+    """
+    stats_html = _stats_comparison_html(match)
+    if stats_html:
+        st.markdown(stats_html, unsafe_allow_html=True)
+
+
+# iCal pieces. The event template is parsed once and filled with format_map;
+# VCALENDAR wrapping happens once per file, not per event.
+_ICAL_HEADER = (
+    "BEGIN:VCALENDAR\n"
+    "VERSION:2.0\n"
+    "PRODID:-//Schlouh Analytics//Match Schedule//EN\n"
+    "CALSCALE:GREGORIAN\n"
+    "METHOD:PUBLISH\n"
+)
+_ICAL_FOOTER = "END:VCALENDAR"
+_ICAL_EVENT_TEMPLATE = (
+    "BEGIN:VEVENT\n"
+    "UID:{uid}\n"
+    "DTSTAMP:{created}\n"
+    "DTSTART;TZID=Europe/London:{dtstart}\n"
+    "DTEND;TZID=Europe/London:{dtend}\n"
+    "SUMMARY:{home} vs {away}\n"
+    "DESCRIPTION:Competition: {league}\\nMatchday: {matchday}\\n\\nKey Stats:\\n"
+    "- {home} PPG: {home_ppg}\\n- {away} PPG: {away_ppg}\\n\\nForm (last 5):\\n"
+    "- {home}: {home_form}\\n- {away}: {away_form}\n"
+    "LOCATION:{venue}\n"
+    "STATUS:CONFIRMED\n"
+    "BEGIN:VALARM\n"
+    "ACTION:DISPLAY\n"
+    "DESCRIPTION:Match starting in 1 hour: {home} vs {away}\n"
+    "TRIGGER:-PT1H\n"
+    "END:VALARM\n"
+    "END:VEVENT\n"
+)
+# RFC 5545 TEXT escaping for free-text fields
+_ICAL_TEXT_ESCAPES = str.maketrans({'\\': '\\\\', ';': '\\;', ',': '\\,', '\n': '\\n'})
+
+
+def _ical_event(match: Dict[str, Any], created: str) -> str:
+    """Fill the VEVENT template for one match.
+
+    Args:
+        match: Match data dictionary
+        created: DTSTAMP value shared by every event in the export
 
     Returns:
-        iCal formatted string
+        VEVENT block (without VCALENDAR wrapper)
     """
     match_id = match.get('match_id', 'unknown')
-    home = match.get('home_team_name', 'TBD')
-    away = match.get('away_team_name', 'TBD')
-    league = match.get('competition_slug', '')
-    matchday = match.get('matchday', 'N/A')
     match_date = match.get('match_date_utc')
-
-    # Generate UIDs and timestamps
-    uid = f"{match_id}@schlouh-analytics.com"
-    created = datetime.now().strftime('%Y%m%dT%H%M%SZ')
+    if isinstance(match_date, str):
+        # Parse before branching: a blank or unparseable string is NaT, not a date
+        match_date = pd.to_datetime(match_date, errors='coerce')
 
     # Format match datetime
-    if match_date:
-        if isinstance(match_date, str):
-            match_date = pd.to_datetime(match_date)
+    if pd.notna(match_date):
         dtstart = match_date.strftime('%Y%m%dT%H%M%S')
         dtend = (match_date + timedelta(hours=2)).strftime('%Y%m%dT%H%M%S')
     else:
         dtstart = datetime.now().strftime('%Y%m%dT120000')
         dtend = (datetime.now() + timedelta(hours=2)).strftime('%Y%m%dT140000')
 
-    # Build description
-    home_form = match.get('home_form', 'N/A')
-    away_form = match.get('away_form', 'N/A')
-    home_ppg = match.get('home_ppg', 'N/A')
-    away_ppg = match.get('away_ppg', 'N/A')
-
-    ical = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Schlouh Analytics//Match Schedule//EN
-CALSCALE:GREGORIAN
-METHOD:PUBLISH
-BEGIN:VEVENT
-UID:{uid}
-DTSTAMP:{created}
-DTSTART;TZID=Europe/London:{dtstart}
-DTEND;TZID=Europe/London:{dtend}
-SUMMARY:{home} vs {away}
-DESCRIPTION:Competition: {league}\\nMatchday: {matchday}\\n\\nKey Stats:\\n- {home} PPG: {home_ppg}\\n- {away} PPG: {away_ppg}\\n\\nForm (last 5):\\n- {home}: {home_form}\\n- {away}: {away_form}
-LOCATION:{match.get('venue', 'TBD')}
-STATUS:CONFIRMED
-BEGIN:VALARM
-ACTION:DISPLAY
-DESCRIPTION:Match starting in 1 hour: {home} vs {away}
-TRIGGER:-PT1H
-END:VALARM
-END:VEVENT
-END:VCALENDAR"""
-
-    return ical
+    return _ICAL_EVENT_TEMPLATE.format_map({
+        'uid': f"{match_id}@schlouh-analytics.com",
+        'created': created,
+        'dtstart': dtstart,
+        'dtend': dtend,
+        'home': str(match.get('home_team_name', 'TBD')).translate(_ICAL_TEXT_ESCAPES),
+        'away': str(match.get('away_team_name', 'TBD')).translate(_ICAL_TEXT_ESCAPES),
+        'league': str(match.get('competition_slug', '')).translate(_ICAL_TEXT_ESCAPES),
+        'matchday': match.get('matchday', 'N/A'),
+        'home_ppg': match.get('home_ppg', 'N/A'),
+        'away_ppg': match.get('away_ppg', 'N/A'),
+        'home_form': match.get('home_form', 'N/A'),
+        'away_form': match.get('away_form', 'N/A'),
+        'venue': str(match.get('venue', 'TBD')).translate(_ICAL_TEXT_ESCAPES),
+    })
 
 
+def generate_ical_event(match: Dict[str, Any]) -> str:
+    """Generate iCal (.ics) format for a match.
+
+    Args:
+        match: Match data dictionary
+
+    Returns:
+        iCal formatted string
+    """
+    created = datetime.now().strftime('%Y%m%dT%H%M%SZ')
+    return _ICAL_HEADER + _ical_event(match, created) + _ICAL_FOOTER
+
+
+# Columns read per match by the exports, with defaults for missing columns
+_CSV_COLUMNS = (
+    ('home_team_name', ''),
+    ('away_team_name', ''),
+    ('competition_slug', ''),
+    ('home_form', ''),
+    ('away_form', ''),
+    ('home_position', ''),
+    ('away_position', ''),
+    ('importance', 'Medium'),
+    ('venue', 'TBD'),
+    ('match_id', ''),
+)
+_ICAL_COLUMNS = (
+    'match_id', 'home_team_name', 'away_team_name', 'competition_slug', 'matchday',
+    'match_date_utc', 'home_form', 'away_form', 'home_ppg', 'away_ppg', 'venue',
+)
+
+
+@st.cache_data(show_spinner=False)
+def generate_ical_calendar(matches_df: pd.DataFrame) -> str:
+    """Generate the iCal export for all matches (cached on DataFrame content).
+
+    Args:
+        matches_df: DataFrame with match data
+
+    Returns:
+        iCal formatted string: one VCALENDAR with a VEVENT per match
+    """
+    matches_df = _ensure_parsed_dates(matches_df, 'match_date_utc')
+    created = datetime.now().strftime('%Y%m%dT%H%M%SZ')
+    # Only materialize the columns the event template reads
+    ical_df = matches_df[[col for col in _ICAL_COLUMNS if col in matches_df.columns]]
+    events = "".join(_ical_event(match, created) for match in ical_df.to_dict('records'))
+    return _ICAL_HEADER + events + _ICAL_FOOTER + "\n"
+
+
+@st.cache_data(show_spinner=False)
 def export_schedule_csv(matches_df: pd.DataFrame) -> str:
     """Export schedule as CSV string.
 
@@ -450,6 +665,7 @@ def export_schedule_csv(matches_df: pd.DataFrame) -> str:
     Returns:
         CSV formatted string
     """
+    matches_df = _ensure_parsed_dates(matches_df, 'match_date_utc')
     output = io.StringIO()
     writer = csv.writer(output)
 
@@ -460,34 +676,30 @@ def export_schedule_csv(matches_df: pd.DataFrame) -> str:
         'Importance', 'Venue', 'Match ID'
     ])
 
-    # Data rows
-    for _, match in matches_df.iterrows():
-        match_date = match.get('match_date_utc', '')
-        if hasattr(match_date, 'strftime'):
-            date_str = match_date.strftime('%Y-%m-%d')
-            time_str = match_date.strftime('%H:%M')
-        else:
-            date_str = str(match_date)[:10] if match_date else ''
-            time_str = ''
-
-        writer.writerow([
-            date_str,
-            time_str,
-            match.get('home_team_name', ''),
-            match.get('away_team_name', ''),
-            match.get('competition_slug', ''),
-            match.get('home_form', ''),
-            match.get('away_form', ''),
-            match.get('home_position', ''),
-            match.get('away_position', ''),
-            match.get('importance', 'Medium'),
-            match.get('venue', 'TBD'),
-            match.get('match_id', ''),
-        ])
+    # Data rows: pull each column out once (struct-of-arrays) and zip them into rows
+    n = len(matches_df)
+    if 'match_date_utc' in matches_df.columns:
+        dates = matches_df['match_date_utc']
+        date_strs = dates.dt.strftime('%Y-%m-%d').fillna('').to_list()
+        time_strs = dates.dt.strftime('%H:%M').fillna('').to_list()
+    else:
+        date_strs = time_strs = [''] * n
+    columns = [
+        matches_df[col].to_list() if col in matches_df.columns else [default] * n
+        for col, default in _CSV_COLUMNS
+    ]
+    writer.writerows(zip(date_strs, time_strs, *columns))
 
     return output.getvalue()
 
 
+def _count_high_importance(matches_df: pd.DataFrame) -> int:
+    """Count High-importance matches without materializing a filtered frame."""
+    if 'importance' not in matches_df.columns:
+        return 0
+    return int((matches_df['importance'] == 'High').sum())
+
+
 def render_export_section(matches_df: pd.DataFrame) -> None:
     """Render export options section.
 
@@ -516,10 +728,7 @@ def render_export_section(matches_df: pd.DataFrame) -> None:
     with export_cols[1]:
         # iCal Export
         if not matches_df.empty:
-            ical_data = ""
-            for _, match in matches_df.iterrows():
-                ical_data += generate_ical_event(match.to_dict()) + "\n"
-
+            ical_data = generate_ical_calendar(matches_df)
             st.download_button(
                 "📅 Download iCal (.ics)",
                 data=ical_data,
@@ -534,7 +743,7 @@ def render_export_section(matches_df: pd.DataFrame) -> None:
         # Summary stats
         if not matches_df.empty:
             total = len(matches_df)
-            high_importance = len(matches_df[matches_df.get('importance', 'Medium') == 'High'])
+            high_importance = _count_high_importance(matches_df)
 
             st.metric("Total Matches", total)
             if high_importance > 0:
@@ -562,14 +771,17 @@ def render_schedule_summary(matches_df: pd.DataFrame) -> None:
     this_week = today + timedelta(days=7)
 
     date_col = 'match_date_utc'
+    matches_df = _ensure_parsed_dates(matches_df, date_col)
     if date_col in matches_df.columns:
-        dates = pd.to_datetime(matches_df[date_col]).dt.date
-        this_week_count = len(matches_df[dates <= this_week])
+        # Sorted day array + binary search; NaT sorts last so it is never counted
+        dates = np.sort(matches_df[date_col].dt.normalize().to_numpy(dtype="datetime64[ns]"))
+        cutoff = np.datetime64(this_week, "ns")
+        this_week_count = int(np.searchsorted(dates, cutoff, side="right"))
     else:
         this_week_count = 0
 
     # High importance
-    high_importance = len(matches_df[matches_df.get('importance', 'Medium') == 'High'])
+    high_importance = _count_high_importance(matches_df)
 
     # Display metrics
     cols = st.columns(4)
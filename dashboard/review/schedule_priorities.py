@@ -4,25 +4,62 @@ import json
 import logging
 import pathlib
 
+import streamlit as st
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 PRIORITIES_FILE = pathlib.Path(__file__).parent / "schedule_priorities.json"
+IMPORTANCE_LEVELS = ("Low", "Medium", "High")
+
+
+def _serialize(priorities: dict) -> bytes:
+    """File contents for priorities (indented JSON); also used to detect no-op saves."""
+    if orjson is not None:
+        return orjson.dumps(priorities, option=orjson.OPT_INDENT_2)
+    return json.dumps(priorities, indent=2).encode("utf-8")
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
 def load_schedule_priorities() -> dict:
-    """Load match_id -> { to_scout: bool, importance: str } from file."""
+    """Load match_id -> { to_scout: bool, importance: str } from file.
+
+    Cached so reruns don't re-read the file; save_schedule_priorities clears the
+    cache after writing. st.cache_data hands each caller its own copy.
+    """
     if not PRIORITIES_FILE.exists():
         return {}
     try:
-        with open(PRIORITIES_FILE, "r") as f:
-            data = json.load(f)
-        return {str(k): v for k, v in data.items()}
+        raw = PRIORITIES_FILE.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        # JSON object keys are already str
+        return data if isinstance(data, dict) else {}
     except (FileNotFoundError, json.JSONDecodeError) as e:
         logger.debug("Could not load schedule priorities: %s", e)
         return {}
 
 
-def save_schedule_priorities(priorities: dict) -> None:
-    """Save priorities to file."""
-    with open(PRIORITIES_FILE, "w") as f:
-        json.dump(priorities, f, indent=2)
+def save_schedule_priorities(priorities: dict) -> bool:
+    """Save priorities to file if they differ from what is currently on disk.
+
+    Compares against the file itself rather than remembered state, so writes
+    from other sessions or processes are never mistaken for "unchanged".
+
+    Returns:
+        True if the file was written, False if the contents were unchanged.
+    """
+    # JSON object keys are str: normalise int match ids once so comparing and writing agree
+    priorities = {str(k): v for k, v in priorities.items()}
+    payload = _serialize(priorities)
+    try:
+        if PRIORITIES_FILE.read_bytes() == payload:
+            return False
+    except FileNotFoundError:
+        pass
+    PRIORITIES_FILE.write_bytes(payload)
+    load_schedule_priorities.clear()
+    return True
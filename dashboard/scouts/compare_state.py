@@ -12,6 +12,13 @@ from typing import List, Dict, Any, Optional
 
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+from dashboard.scouts.layout import read_json_cached
+
 logger = logging.getLogger(__name__)
 
 _SCOUTS_DIR = pathlib.Path(__file__).parent
@@ -107,8 +114,7 @@ def load_scouts_compare_list() -> List[int]:
     if not _COMPARE_LIST_SCOUTS_FILE.exists():
         return []
     try:
-        with open(_COMPARE_LIST_SCOUTS_FILE, "r") as f:
-            data = json.load(f)
+        data = read_json_cached(_COMPARE_LIST_SCOUTS_FILE)
         if isinstance(data, list):
             return [int(x) for x in data if isinstance(x, (int, float))][:MAX_PLAYERS]
         ids = data.get("player_ids", data.get("entries", []))
@@ -127,8 +133,7 @@ def load_scouts_compare_entries() -> List[Dict[str, Any]]:
     if not _COMPARE_LIST_SCOUTS_FILE.exists():
         return []
     try:
-        with open(_COMPARE_LIST_SCOUTS_FILE, "r") as f:
-            data = json.load(f)
+        data = read_json_cached(_COMPARE_LIST_SCOUTS_FILE)
         entries = data.get("entries", [])
         if entries:
             return [
@@ -160,10 +165,13 @@ def save_scouts_compare_list(ids: List[int], seasons_by_id: Optional[Dict[int, D
                 }
                 for pid in ids
             ]
-            with open(_COMPARE_LIST_SCOUTS_FILE, "w") as f:
-                json.dump({"player_ids": ids, "entries": entries}, f, indent=0)
+            payload = {"player_ids": ids, "entries": entries}
+        else:
+            payload = {"player_ids": ids}
+        if orjson is not None:
+            _COMPARE_LIST_SCOUTS_FILE.write_bytes(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY))
         else:
             with open(_COMPARE_LIST_SCOUTS_FILE, "w") as f:
-                json.dump({"player_ids": ids}, f, indent=0)
+                json.dump(payload, f, indent=0)
     except Exception as e:
         logger.warning("Save compare list failed: %s", e)
@@ -9,33 +9,72 @@ from __future__ import annotations
 import json
 import logging
 import pathlib
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 _SCOUTS_DIR = pathlib.Path(__file__).parent
+_DEFAULT_SHORTLIST = _SCOUTS_DIR / "shortlist_data.json"
 
 
 def get_shortlist_file_path(query_user: Optional[str] = None) -> pathlib.Path:
     """Path to shortlist JSON: per-user when ?user= or ?user_id= is set, else shortlist_data.json."""
     if not (query_user and str(query_user).strip()):
-        return _SCOUTS_DIR / "shortlist_data.json"
+        return _DEFAULT_SHORTLIST
     safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in str(query_user).strip())[:64]
     return _SCOUTS_DIR / f"shortlist_{safe}.json"
 
 
+def resolve_shortlist_path() -> pathlib.Path:
+    """Resolve this rerun's shortlist path from ?user= / ?user_id= and keep it in session state.
+
+    render_sidebar calls this once per rerun; load/save then reuse the stored path
+    instead of querying st.query_params each time.
+    """
+    user = st.query_params.get("user") or st.query_params.get("user_id")
+    path = get_shortlist_file_path(user) if user else _DEFAULT_SHORTLIST
+    st.session_state["_shortlist_path"] = path
+    return path
+
+
+def _shortlist_path() -> pathlib.Path:
+    """Shortlist path resolved for this rerun (resolves it if the sidebar has not yet)."""
+    path = st.session_state.get("_shortlist_path")
+    return path if path is not None else resolve_shortlist_path()
+
+
+@lru_cache(maxsize=16)
+def _read_json(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file; memoized on (path, mtime, size) so it is only re-read after a write."""
+    raw = pathlib.Path(path_str).read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def read_json_cached(path: pathlib.Path) -> Any:
+    """Parsed contents of a JSON file, re-parsed only when its mtime or size changes.
+
+    The returned object is shared between calls, so callers must copy before mutating.
+    """
+    stat = path.stat()
+    return _read_json(str(path), stat.st_mtime_ns, stat.st_size)
+
+
 def load_shortlist_from_file() -> list:
     """Load shortlist from file (path from query params user/user_id). Use on every page that needs shortlist."""
-    path = get_shortlist_file_path(
-        st.query_params.get("user") or st.query_params.get("user_id")
-    )
+    path = _shortlist_path()
     if not path.exists():
         return []
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data if isinstance(data, list) else []
+        data = read_json_cached(path)
+        # Copy each entry: pages edit shortlist dicts in place and the parse is shared
+        return [dict(p) if isinstance(p, dict) else p for p in data] if isinstance(data, list) else []
     except (IOError, OSError, json.JSONDecodeError) as e:
         logger.debug("Load shortlist failed: %s", e)
         return []
@@ -43,13 +82,14 @@ def load_shortlist_from_file() -> list:
 
 def save_shortlist_to_file(data: list) -> None:
     """Save shortlist to file."""
-    path = get_shortlist_file_path(
-        st.query_params.get("user") or st.query_params.get("user_id")
-    )
+    path = _shortlist_path()
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
     except (IOError, OSError) as e:
         logger.warning("Save shortlist failed: %s", e)
         raise
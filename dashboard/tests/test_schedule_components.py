@@ -0,0 +1,49 @@
+"""Tests for Review Schedule components (dashboard/review/components/schedule_components.py)."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+
+from dashboard.review.components import schedule_components as sc
+
+
+def _card_html(match: dict) -> str:
+    """Render a compact card and return the HTML passed to st.markdown."""
+    with patch.object(sc.st, "markdown") as markdown:
+        sc.render_match_card(match, compact=True, show_form=False)
+    return "".join(str(c.args[0]) for c in markdown.call_args_list)
+
+
+class TestRenderMatchCard:
+    """Test render_match_card date handling."""
+
+    def test_string_match_date(self):
+        """A string match_date_utc is parsed and its kick-off time shown."""
+        html = _card_html({"match_date_utc": "2025-01-01 12:00", "home_team_name": "A", "away_team_name": "B"})
+        assert "⏰ 12:00" in html
+
+    def test_blank_string_match_date_is_tbc(self):
+        """A blank date string renders as TBC instead of raising."""
+        html = _card_html({"match_date_utc": "", "home_team_name": "A", "away_team_name": "B"})
+        assert "⏰ TBC" in html
+
+
+class TestGenerateIcalEvent:
+    """Test generate_ical_event date handling."""
+
+    def test_string_match_date(self):
+        """A string date is used for DTSTART/DTEND."""
+        ics = sc.generate_ical_event({"match_id": 1, "match_date_utc": "2025-01-01 12:00"})
+        assert "20250101T120000" in ics
+        assert "20250101T140000" in ics
+
+    def test_blank_match_date_falls_back_to_today(self):
+        """A blank date falls back to today 12:00 instead of raising on NaT."""
+        ics = sc.generate_ical_event({"match_id": 1, "match_date_utc": ""})
+        assert datetime.now().strftime("%Y%m%dT120000") in ics
+
+    def test_timestamp_match_date(self):
+        """Already-parsed timestamps are formatted unchanged."""
+        ics = sc.generate_ical_event({"match_id": 1, "match_date_utc": pd.Timestamp("2025-03-02 19:45")})
+        assert "20250302T194500" in ics
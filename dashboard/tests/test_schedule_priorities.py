@@ -0,0 +1,38 @@
+"""Tests for schedule priorities persistence (dashboard/review/schedule_priorities.py)."""
+
+import pytest
+
+from dashboard.review import schedule_priorities as sp
+
+
+@pytest.fixture
+def priorities_file(tmp_path, monkeypatch):
+    """Point PRIORITIES_FILE at a temp file and start from an empty load cache."""
+    path = tmp_path / "schedule_priorities.json"
+    monkeypatch.setattr(sp, "PRIORITIES_FILE", path)
+    sp.load_schedule_priorities.clear()
+    yield path
+    sp.load_schedule_priorities.clear()
+
+
+class TestSaveSchedulePriorities:
+    """Test save_schedule_priorities."""
+
+    def test_saves_int_match_ids(self, priorities_file):
+        """Int match ids are written as str keys, like json.dump does."""
+        assert sp.save_schedule_priorities({123: {"to_scout": True, "importance": "High"}}) is True
+        assert sp.load_schedule_priorities() == {"123": {"to_scout": True, "importance": "High"}}
+
+    def test_unchanged_priorities_are_not_rewritten(self, priorities_file):
+        """Saving the same priorities twice only writes once."""
+        priorities = {"1": {"to_scout": False, "importance": "Low"}}
+        assert sp.save_schedule_priorities(priorities) is True
+        assert sp.save_schedule_priorities(dict(priorities)) is False
+
+    def test_external_change_is_overwritten(self, priorities_file):
+        """A save is only skipped when the file on disk already matches."""
+        priorities = {"1": {"to_scout": True, "importance": "Medium"}}
+        assert sp.save_schedule_priorities(priorities) is True
+        priorities_file.write_text("{}")
+        assert sp.save_schedule_priorities(priorities) is True
+        assert sp.load_schedule_priorities() == priorities
@@ -112,9 +112,8 @@ def get_accessible_colors() -> dict:
     }
 
 
-def inject_accessibility_css() -> None:
-    """Inject CSS for accessibility enhancements."""
-    st.markdown("""
+# Static stylesheet; also bundled into styles.inject_css().
+ACCESSIBILITY_CSS = """
     <style>
     /* Screen reader only content */
     .sr-only {
@@ -186,7 +185,12 @@ def inject_accessibility_css() -> None:
         padding-left: 12px;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+
+def inject_accessibility_css() -> None:
+    """Inject CSS for accessibility enhancements."""
+    st.markdown(ACCESSIBILITY_CSS, unsafe_allow_html=True)
 
 
 def render_accessibility_toolbar() -> None:
@@ -5,6 +5,7 @@ for scouting reports. Phase 1 uses rule-based logic; Phase 2
 will incorporate ML models trained on inferred transfer success.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Any
 import pandas as pd
@@ -393,20 +394,19 @@ def get_badge_summary(badges: List[Badge]) -> Dict[str, Any]:
     
     Returns dict with counts and key badges by category.
     """
-    summary = {
+    positive = 0
+    by_category = defaultdict(list)
+    for badge in badges:
+        positive += bool(badge.is_positive)
+        by_category[badge.category].append(badge)
+
+    return {
         "total": len(badges),
-        "positive": len([b for b in badges if b.is_positive]),
-        "negative": len([b for b in badges if not b.is_positive]),
-        "by_category": {}
+        "positive": positive,
+        "negative": len(badges) - positive,
+        # Plain dict for callers: missing categories should not silently appear
+        "by_category": dict(by_category),
     }
-    
-    for badge in badges:
-        cat = badge.category
-        if cat not in summary["by_category"]:
-            summary["by_category"][cat] = []
-        summary["by_category"][cat].append(badge)
-    
-    return summary
 
 
 def format_badge_for_display(badge: Badge) -> str:
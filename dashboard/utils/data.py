@@ -217,6 +217,23 @@ def load_team_season_stats() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def _competitions_for(rows: pd.DataFrame, team_stats: pd.DataFrame) -> list:
+    """Competition slugs per (team_name, season) of rows, via one groupby lookup.
+
+    Args:
+        rows: Frame with team_name and season columns.
+        team_stats: From load_team_season_stats().
+
+    Returns:
+        List (aligned with rows) of competition slug lists, in first-seen order.
+    """
+    by_team_season = team_stats.groupby(["team_name", "season"], sort=False)["competition_slug"].unique().to_dict()
+    return [
+        list(by_team_season.get(key, []))
+        for key in zip(rows["team_name"], rows["season"])
+    ]
+
+
 def get_team_season_selector_options(
     team_stats: pd.DataFrame,
     default_season: Optional[str] = None,
@@ -254,17 +271,12 @@ def get_team_season_selector_options(
 
     if label_format == "full" and comp_name_getter:
         df["comp_label"] = df["competition_slug"].map(lambda c: comp_name_getter(c) or c)
-        df["label"] = df.apply(
-            lambda r: f"{r['team_name']} ({r['season']}, {r['comp_label']} — {int(r['n_matches'])} matches)",
-            axis=1,
+        df["label"] = (
+            df["team_name"].astype(str) + " (" + df["season"].astype(str) + ", "
+            + df["comp_label"].astype(str) + " — " + df["n_matches"].astype(str) + " matches)"
         )
         out = df[["team_name", "season", "competition_slug", "label", "n_matches"]].copy()
-        out["competitions"] = out.apply(
-            lambda r: team_stats[
-                (team_stats["team_name"] == r["team_name"]) & (team_stats["season"] == r["season"])
-            ]["competition_slug"].unique().tolist(),
-            axis=1,
-        )
+        out["competitions"] = _competitions_for(out, team_stats)
         return out.drop_duplicates(subset=["team_name", "season", "competition_slug"])
 
     # short: one row per (team_name, season)
@@ -272,24 +284,27 @@ def get_team_season_selector_options(
         competition_slug=("competition_slug", "first"),
         n_matches=("n_matches", "sum"),
     ).reset_index()
-    agg["label"] = agg.apply(lambda r: f"{r['team_name']} ({r['season']})", axis=1)
-    agg["competitions"] = agg.apply(
-        lambda r: team_stats[
-            (team_stats["team_name"] == r["team_name"]) & (team_stats["season"] == r["season"])
-        ]["competition_slug"].unique().tolist(),
-        axis=1,
-    )
+    agg["label"] = agg["team_name"].astype(str) + " (" + agg["season"].astype(str) + ")"
+    agg["competitions"] = _competitions_for(agg, team_stats)
     return agg[["team_name", "season", "competition_slug", "label", "competitions", "n_matches"]]
 
 
 @st.cache_data(show_spinner=False, ttl=3600)
 def load_match_summary() -> pd.DataFrame:
-    """Match-level summary from 02_match_summary.parquet."""
+    """Match-level summary from 02_match_summary.parquet.
+
+    match_date_utc is returned as tz-naive UTC datetime64 so callers can compare
+    and sort without re-parsing the column on every rerun, and stay on the fast
+    naive datetime path (tz-aware columns are much slower to compare and convert).
+    """
     try:
-        return pd.read_parquet(PROJECT_ROOT / "data/processed/02_match_summary.parquet")
+        df = pd.read_parquet(PROJECT_ROOT / "data/processed/02_match_summary.parquet")
     except Exception as e:
         logger.warning("load_match_summary failed: %s", e)
         return pd.DataFrame()
+    if "match_date_utc" in df.columns:
+        df["match_date_utc"] = pd.to_datetime(df["match_date_utc"], errors="coerce", utc=True).dt.tz_convert(None)
+    return df
 
 
 @st.cache_data(show_spinner=False, ttl=3600)
@@ -688,7 +703,7 @@ def compute_percentiles(df: pd.DataFrame, group_cols: list, stat_cols: list) ->
         if stat not in df.columns:
             continue
         result[f"{stat}_pct"] = (
-            df.groupby(group_cols)[stat]
+            df.groupby(group_cols, observed=True)[stat]
             .rank(pct=True, na_option="keep")
             .mul(100)
         )
@@ -707,27 +722,38 @@ def compute_percentiles_zscore(
     """
     from scipy.stats import norm
     result = df.copy()
-    for stat in stat_cols:
-        if stat not in df.columns:
-            continue
-        s = df[stat]
-        if len(group_cols) == 0:
-            mean = s.mean()
-            std = s.std()
-            if pd.isna(std) or std < 1e-10:
-                result[f"{stat}_pct"] = 50.0
-            else:
-                z = (s - mean) / std
-                result[f"{stat}_pct"] = np.asarray(norm.cdf(z)) * 100
-        else:
-            def _z_to_pct(x: pd.Series) -> pd.Series:
-                m, sd = x.mean(), x.std()
-                if pd.isna(sd) or sd < 1e-10:
-                    return pd.Series(50.0, index=x.index)
-                z = (x - m) / sd
-                pct_arr = np.asarray(norm.cdf(z)) * 100
-                return pd.Series(pct_arr, index=x.index)
-            result[f"{stat}_pct"] = df.groupby(group_cols)[stat].transform(_z_to_pct)
+    stats = [c for c in stat_cols if c in df.columns]
+    if not stats:
+        return result
+    if len(group_cols) > 0:
+        # Group codes once for all stats; rows with a missing key stay NaN, as in groupby.transform
+        codes = df.groupby(group_cols, sort=False, observed=True).ngroup().to_numpy(dtype=float, na_value=np.nan)
+        valid = ~np.isnan(codes)
+        codes = np.where(valid, codes, 0).astype(np.intp)
+        n_groups = int(codes[valid].max()) + 1 if valid.any() else 1
+    else:
+        # A single pool is one group
+        codes = np.zeros(len(df), dtype=np.intp)
+        valid = np.ones(len(df), dtype=bool)
+        n_groups = 1
+    # All stats as one (rows x stats) block; (group, stat) cells are flattened so that one
+    # bincount per moment covers every stat: per-cell mean/std (ddof=1, NaN skipped)
+    x = df[stats].to_numpy(dtype=float, na_value=np.nan)
+    k = len(stats)
+    ok = valid[:, None] & ~np.isnan(x)
+    cell = (codes[:, None] * k + np.arange(k))[ok]
+    size = n_groups * k
+    cnt = np.bincount(cell, minlength=size).reshape(n_groups, k)
+    mean = np.bincount(cell, weights=x[ok], minlength=size).reshape(n_groups, k) / np.maximum(cnt, 1)
+    dev = x - mean[codes]
+    sd = np.sqrt(
+        np.bincount(cell, weights=dev[ok] ** 2, minlength=size).reshape(n_groups, k) / np.maximum(cnt - 1, 1)
+    )
+    # Fewer than 2 values or ~zero spread: every row in the group is 50
+    flat = ((cnt < 2) | (sd < 1e-10))[codes]
+    pct = np.where(flat, 50.0, np.asarray(norm.cdf(dev / np.where(flat, 1.0, sd[codes]))) * 100)
+    pct[~valid] = np.nan
+    result[[f"{stat}_pct" for stat in stats]] = pct
     return result
 
 
@@ -876,6 +902,38 @@ def get_available_comp_seasons() -> pd.DataFrame:
 # Helper: derive W-D-L for a team from match_summary
 # ---------------------------------------------------------------------------
 
+def _scored_from_perspective(matches: pd.DataFrame, team_name: str) -> tuple:
+    """Drop unscored matches and compute goals/result from team_name's side.
+
+    Args:
+        matches: Match summary rows involving team_name.
+        team_name: Team whose perspective is used for goals for/against.
+
+    Returns:
+        (scored, is_home, gf, ga, result) where scored is the filtered frame and
+        the rest are NumPy arrays aligned with it.
+    """
+    h = pd.to_numeric(matches["home_score"], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    a = pd.to_numeric(matches["away_score"], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    played = ~(np.isnan(h) | np.isnan(a))
+    scored = matches[played]
+    h, a = h[played].astype(int), a[played].astype(int)
+    is_home = (scored["home_team_name"] == team_name).to_numpy()
+    gf = np.where(is_home, h, a)
+    ga = np.where(is_home, a, h)
+    result = np.select([gf > ga, gf == ga], ["W", "D"], default="L")
+    return scored, is_home, gf, ga, result
+
+
+def _side_values(scored: pd.DataFrame, is_home: np.ndarray, own_col: str, other_col: str):
+    """Pick own_col where is_home else other_col; None when either column is missing."""
+    if own_col not in scored.columns or other_col not in scored.columns:
+        return None
+    own = pd.to_numeric(scored[own_col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    other = pd.to_numeric(scored[other_col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    return np.where(is_home, own, other)
+
+
 @st.cache_data(show_spinner=False, ttl=3600)
 def get_team_wdl(team_name: str, season: str, competition_slug: str) -> dict:
     """Return wins, draws, losses for a team in a given season/competition."""
@@ -885,28 +943,10 @@ def get_team_wdl(team_name: str, season: str, competition_slug: str) -> dict:
         (ms["season"] == season) &
         (ms["competition_slug"] == competition_slug)
     )
-    team_matches = ms[mask].copy()
-
-    wins = draws = losses = 0
-    for _, row in team_matches.iterrows():
-        h, a = row["home_score"], row["away_score"]
-        if pd.isna(h) or pd.isna(a):
-            continue
-        h, a = int(h), int(a)
-        if row["home_team_name"] == team_name:
-            if h > a:
-                wins += 1
-            elif h == a:
-                draws += 1
-            else:
-                losses += 1
-        else:
-            if a > h:
-                wins += 1
-            elif a == h:
-                draws += 1
-            else:
-                losses += 1
+    _, _, _, _, result = _scored_from_perspective(ms[mask], team_name)
+    wins = int((result == "W").sum())
+    draws = int((result == "D").sum())
+    losses = int((result == "L").sum())
     return {"W": wins, "D": draws, "L": losses, "matches": wins + draws + losses}
 
 
@@ -919,45 +959,28 @@ def get_team_last_matches(team_name: str, season: str, competition_slug: str, n:
         (ms["season"] == season) &
         (ms["competition_slug"] == competition_slug)
     )
-    team_matches = ms[mask].copy().sort_values("match_date_utc", ascending=False)
+    team_matches = ms[mask].sort_values("match_date_utc", ascending=False)
 
-    rows = []
-    for _, row in team_matches.iterrows():
-        h, a = row["home_score"], row["away_score"]
-        if pd.isna(h) or pd.isna(a):
-            continue
-        h, a = int(h), int(a)
-        is_home = row["home_team_name"] == team_name
-        opponent = row["away_team_name"] if is_home else row["home_team_name"]
-        gf = h if is_home else a
-        ga = a if is_home else h
-        xg_for = row.get("home_xg" if is_home else "away_xg")
-        xg_against = row.get("away_xg" if is_home else "home_xg")
-        possession = row.get("home_possession" if is_home else "away_possession")
-        big_chances = row.get("home_big_chances" if is_home else "away_big_chances")
-        if gf > ga:
-            result = "W"
-        elif gf == ga:
-            result = "D"
-        else:
-            result = "L"
-        rows.append({
-            "date": row.get("match_date_utc"),
-            "opponent": opponent,
-            "home_away": "H" if is_home else "A",
-            "score": f"{gf}–{ga}",
-            "result": result,
-            "xg_for": xg_for,
-            "xg_against": xg_against,
-            "possession": possession,
-            "big_chances": big_chances,
-            "match_id": row.get("match_id"),
-        })
-
-    df_out = pd.DataFrame(rows)
-    return df_out.head(n) if not df_out.empty else df_out
+    scored, is_home, gf, ga, result = _scored_from_perspective(team_matches, team_name)
+    if scored.empty:
+        return pd.DataFrame()
+    # Only the last n scored matches are returned, so build columns for those alone
+    scored, is_home, gf, ga, result = scored.iloc[:n], is_home[:n], gf[:n], ga[:n], result[:n]
+    return pd.DataFrame({
+        "date": scored["match_date_utc"].reset_index(drop=True),
+        "opponent": np.where(is_home, scored["away_team_name"].to_numpy(), scored["home_team_name"].to_numpy()),
+        "home_away": np.where(is_home, "H", "A"),
+        "score": pd.Series(gf).astype(str) + "–" + pd.Series(ga).astype(str),
+        "result": result,
+        "xg_for": _side_values(scored, is_home, "home_xg", "away_xg"),
+        "xg_against": _side_values(scored, is_home, "away_xg", "home_xg"),
+        "possession": _side_values(scored, is_home, "home_possession", "away_possession"),
+        "big_chances": _side_values(scored, is_home, "home_big_chances", "away_big_chances"),
+        "match_id": scored["match_id"].reset_index(drop=True) if "match_id" in scored.columns else None,
+    })
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
 def get_team_form(
     team_name: str, season: str, competition_slug: str, n: int = 5
 ) -> dict:
@@ -986,7 +1009,7 @@ def get_team_home_away_summary(
         (ms["season"] == season) &
         (ms["competition_slug"] == competition_slug)
     )
-    team_matches = ms[mask].copy()
+    team_matches = ms[mask]
 
     def _empty_side() -> dict:
         return {
@@ -1001,37 +1024,20 @@ def get_team_home_away_summary(
     def _side_stats(subset: pd.DataFrame, is_home: bool) -> dict:
         if subset.empty:
             return _empty_side()
-        w = d = l = 0
-        goals_for = goals_against = 0
-        xg_for = xg_against = 0.0
-        for _, row in subset.iterrows():
-            h, a = row["home_score"], row["away_score"]
-            if pd.isna(h) or pd.isna(a):
-                continue
-            h, a = int(h), int(a)
-            gf = h if is_home else a
-            ga = a if is_home else h
-            goals_for += gf
-            goals_against += ga
-            xf = row.get("home_xg") if is_home else row.get("away_xg")
-            xa = row.get("away_xg") if is_home else row.get("home_xg")
-            if pd.notna(xf):
-                xg_for += float(xf)
-            if pd.notna(xa):
-                xg_against += float(xa)
-            if gf > ga:
-                w += 1
-            elif gf == ga:
-                d += 1
-            else:
-                l += 1
+        scored, _, gf, ga, result = _scored_from_perspective(subset, team_name)
+        own, other = ("home_xg", "away_xg") if is_home else ("away_xg", "home_xg")
+        xf = pd.to_numeric(scored[own], errors="coerce") if own in scored.columns else pd.Series(dtype=float)
+        xa = pd.to_numeric(scored[other], errors="coerce") if other in scored.columns else pd.Series(dtype=float)
+        w = int((result == "W").sum())
+        d = int((result == "D").sum())
+        l = int((result == "L").sum())
         return {
             "W": w, "D": d, "L": l,
             "matches": w + d + l,
-            "goals_for": goals_for,
-            "goals_against": goals_against,
-            "xg_for": xg_for,
-            "xg_against": xg_against,
+            "goals_for": int(gf.sum()),
+            "goals_against": int(ga.sum()),
+            "xg_for": float(xf.sum()),
+            "xg_against": float(xa.sum()),
         }
 
     home_matches = team_matches[team_matches["home_team_name"] == team_name]
@@ -1062,30 +1068,22 @@ def get_head_to_head(
         mask = mask & (ms["season"] == season)
     if competition_slug is not None:
         mask = mask & (ms["competition_slug"] == competition_slug)
-    h2h = ms[mask].copy().sort_values("match_date_utc", ascending=False).head(n)
+    h2h = ms[mask].sort_values("match_date_utc", ascending=False).head(n)
     if h2h.empty:
         return pd.DataFrame()
-    rows = []
-    for _, row in h2h.iterrows():
-        h, a = row["home_score"], row["away_score"]
-        if pd.isna(h) or pd.isna(a):
-            continue
-        h, a = int(h), int(a)
-        is_home_a = row["home_team_name"] == team_a
-        gf = h if is_home_a else a
-        ga = a if is_home_a else h
-        result = "W" if gf > ga else "D" if gf == ga else "L"
-        rows.append({
-            "date": row.get("match_date_utc"),
-            "opponent": team_b,
-            "home_away": "H" if is_home_a else "A",
-            "score": f"{gf}–{ga}",
-            "result": result,
-            "xg_for": row.get("home_xg" if is_home_a else "away_xg"),
-            "xg_against": row.get("away_xg" if is_home_a else "home_xg"),
-            "match_id": row.get("match_id"),
-        })
-    return pd.DataFrame(rows)
+    scored, is_home_a, gf, ga, result = _scored_from_perspective(h2h, team_a)
+    if scored.empty:
+        return pd.DataFrame()
+    return pd.DataFrame({
+        "date": scored["match_date_utc"].reset_index(drop=True),
+        "opponent": team_b,
+        "home_away": np.where(is_home_a, "H", "A"),
+        "score": pd.Series(gf).astype(str) + "–" + pd.Series(ga).astype(str),
+        "result": result,
+        "xg_for": _side_values(scored, is_home_a, "home_xg", "away_xg"),
+        "xg_against": _side_values(scored, is_home_a, "away_xg", "home_xg"),
+        "match_id": scored["match_id"].reset_index(drop=True) if "match_id" in scored.columns else None,
+    })
 
 
 def validate_tactics_data(team_stats: pd.DataFrame, tactical_profiles: pd.DataFrame) -> list[str]:
@@ -1633,15 +1631,18 @@ def get_form_xi(
         .reset_index()
     )
 
-    best_xi = []
-    for pos in ["G", "D", "M", "F"]:
-        pos_players = agg[agg[pos_col] == pos].sort_values("avg_rating", ascending=False)
-        if not pos_players.empty:
-            best = pos_players.iloc[0].copy()
-            best["position"] = pos
-            best_xi.append(best)
-
-    return pd.DataFrame(best_xi) if best_xi else pd.DataFrame()
+    # One sort, then the first row per position is that position's best-rated player
+    top_by_pos = (
+        agg.sort_values("avg_rating", ascending=False)
+        .drop_duplicates(pos_col)
+        .set_index(pos_col, drop=False)
+    )
+    positions = [pos for pos in ("G", "D", "M", "F") if pos in top_by_pos.index]
+    if not positions:
+        return pd.DataFrame()
+    best_xi = top_by_pos.loc[positions].reset_index(drop=True)
+    best_xi["position"] = positions
+    return best_xi
 
 
 # ---------------------------------------------------------------------------
@@ -1,5 +1,6 @@
 """Reusable filter utilities to reduce code duplication across pages."""
 
+from functools import lru_cache
 from typing import Optional, Tuple
 import pandas as pd
 import streamlit as st
@@ -11,6 +12,16 @@ from dashboard.utils.scope import CURRENT_SEASON, DEFAULT_COMPETITION_SLUGS
 from dashboard.utils.types import FilterConfig
 
 
+@lru_cache(maxsize=128)
+def comp_label_map(comps: tuple, default_flag: str = "🏆") -> dict:
+    """Return {slug: "<flag> <name>"} for comps, for use as format_func=labels.get.
+
+    Cached per option tuple so widgets do not rebuild the label string for every
+    option on every rerun. The returned dict is shared; do not mutate it.
+    """
+    return {c: f"{COMP_FLAGS.get(c, default_flag)} {COMP_NAMES.get(c, c)}" for c in comps}
+
+
 def _league_selector_core(
     df: pd.DataFrame,
     key: str,
@@ -27,7 +38,7 @@ def _league_selector_core(
         label,
         options=avail_leagues,
         default=defaults,
-        format_func=lambda x: league_labels[x],
+        format_func=league_labels.get,
         placeholder="All leagues",
         key=key,
         help="Default: leagues + UEFA only.",
@@ -63,7 +74,7 @@ def create_league_selector(
         avail_leagues = avail
         defaults = [s for s in default_scope_slugs if s in avail_leagues] if default_scope_slugs else []
 
-    league_labels = {s: f"{COMP_FLAGS.get(s, '🏆')} {COMP_NAMES.get(s, s)}" for s in avail_leagues}
+    league_labels = comp_label_map(tuple(avail_leagues))
 
     if compact:
         # Dropdown-style: expander "League (N selected)" with multiselect inside (saves space)
@@ -84,7 +95,7 @@ def create_league_selector(
                     help="Filter to Premier League, La Liga, Serie A, Bundesliga, Ligue 1",
                 )
                 avail_leagues = [s for s in TOP_5_LEAGUES if s in avail] if top5_only else avail
-                league_labels = {s: f"{COMP_FLAGS.get(s, '🏆')} {COMP_NAMES.get(s, s)}" for s in avail_leagues}
+                league_labels = comp_label_map(tuple(avail_leagues))
                 defaults = avail_leagues if top5_only else ([s for s in default_scope_slugs if s in avail_leagues] if default_scope_slugs else [])
             else:
                 avail_leagues = avail_leagues_compact
@@ -104,7 +115,7 @@ def create_league_selector(
                 )
             with row2:
                 avail_leagues = [s for s in TOP_5_LEAGUES if s in avail] if top5_only else avail
-                league_labels = {s: f"{COMP_FLAGS.get(s, '🏆')} {COMP_NAMES.get(s, s)}" for s in avail_leagues}
+                league_labels = comp_label_map(tuple(avail_leagues))
                 defaults = avail_leagues if top5_only else ([s for s in default_scope_slugs if s in avail_leagues] if default_scope_slugs else [])
                 return _league_selector_core(df, key, label, default_all, top5_only, default_scope_slugs, avail_leagues, league_labels, defaults)
         else:
@@ -10,9 +10,8 @@ This module provides:
 import streamlit as st
 
 
-def inject_responsive_css() -> None:
-    """Inject responsive CSS that adapts to mobile screens."""
-    st.markdown("""
+# Static stylesheet; also bundled into styles.inject_css().
+RESPONSIVE_CSS = """
     <style>
     /* ===== BASE RESPONSIVE STYLES ===== */
     
@@ -199,7 +198,12 @@ def inject_responsive_css() -> None:
         }
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+
+def inject_responsive_css() -> None:
+    """Inject responsive CSS that adapts to mobile screens."""
+    st.markdown(RESPONSIVE_CSS, unsafe_allow_html=True)
 
 
 def is_mobile() -> bool:
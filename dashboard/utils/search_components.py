@@ -164,11 +164,17 @@ def get_recent_searches(limit: int = 5) -> List[str]:
     cutoff = datetime.now() - timedelta(days=HISTORY_CUTOFF_DAYS)
     history = st.session_state.search_history
 
-    # Filter out old entries
-    valid_history = [
-        entry for entry in history
-        if isinstance(entry, dict) and datetime.fromisoformat(entry.get('timestamp', '2000-01-01')) > cutoff
-    ]
+    # Filter out old entries: parse all timestamps in one vectorized pass
+    entries = [entry for entry in history if isinstance(entry, dict)]
+    if not entries:
+        return []
+    stamps = pd.to_datetime(
+        pd.Series([entry.get('timestamp', '2000-01-01') for entry in entries]),
+        errors='coerce',
+        format='ISO8601',
+    )
+    keep = (stamps > cutoff).to_numpy()
+    valid_history = [entry for entry, fresh in zip(entries, keep) if fresh]
 
     # Return recent queries (most recent first)
     recent = [entry['query'] for entry in valid_history[-limit:][::-1]]
@@ -6,11 +6,14 @@ for all sections: Scouting, Teams & Tactics, Data & AI.
 
 import streamlit as st
 from dashboard.utils.styles import inject_css
-from dashboard.utils.responsive_styles import inject_responsive_css
 from dashboard.utils.paths import PROJECT_ROOT
 from dashboard.utils.constants import STAT_TOOLTIPS
+from dashboard.scouts.layout import resolve_shortlist_path
 
 _LOGO = PROJECT_ROOT / "dashboard" / "assets" / "logo.png"
+# Resolved once at import: the asset does not move during a session.
+_LOGO_EXISTS = _LOGO.exists()
+_LOGO_STR = str(_LOGO) if _LOGO_EXISTS else None
 
 
 def _get_compare_count() -> int:
@@ -34,15 +37,15 @@ def _get_shortlist_count() -> int:
 def render_sidebar() -> None:
     """Render the unified sidebar: brand, nav sections, compare/shortlist widgets, footer."""
 
+    resolve_shortlist_path()
     inject_css()
-    inject_responsive_css()
 
     with st.sidebar:
         # ----------------------------------------------------------------
         # Brand
         # ----------------------------------------------------------------
-        if _LOGO.exists():
-            st.image(str(_LOGO), width=90)
+        if _LOGO_EXISTS:
+            st.image(_LOGO_STR, width=90)
             st.markdown(
                 "<div class='sb-brand-tagline' style='text-align:center;"
                 "margin-top:-4px;margin-bottom:12px;padding-bottom:12px;"
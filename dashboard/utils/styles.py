@@ -12,6 +12,9 @@ Text:        #F0F6FC (primary)  |  #8B949E (muted)  |  #C9D1D9 (secondary)
 Status:      #6BCB77 (success)  |  #FFD93D (warning)  |  #FF6B6B (danger)  |  #4D96FF (info)
 """
 
+import textwrap
+from functools import lru_cache
+
 import streamlit as st
 
 # ---------------------------------------------------------------------------
@@ -1159,6 +1162,19 @@ html, body, [class*="css"] {
     color: #C9D1D9 !important;
 }
 
+/* ============================================================
+   MATCH CALENDAR (Review schedule)
+   ============================================================ */
+.cal-row,
+.cal-week {
+    display: grid;
+    grid-template-columns: repeat(7, minmax(0, 1fr));
+    gap: 8px;
+}
+.cal-row  { margin-bottom: 8px; }
+.cal-week { margin: 4px 0; }
+.cal-header { text-align: center; font-weight: bold; color: #8B949E; }
+
 /* ============================================================
    CHART CONTAINERS (Plotly)
    ============================================================ */
@@ -1222,11 +1238,28 @@ header    { visibility: hidden; }
 """
 
 
-def inject_css() -> None:
-    """Inject the shared Schlouh Analytics design system CSS and accessibility enhancements."""
-    st.markdown(_CSS, unsafe_allow_html=True)
+@lru_cache(maxsize=1)
+def _css_bundle() -> str:
+    """Design system, accessibility and responsive CSS joined into one payload, built once."""
+    parts = [_CSS]
+    try:
+        from dashboard.utils.accessibility import ACCESSIBILITY_CSS
+        parts.append(ACCESSIBILITY_CSS)
+    except Exception:
+        pass
     try:
-        from dashboard.utils.accessibility import inject_accessibility_css
-        inject_accessibility_css()
+        from dashboard.utils.responsive_styles import RESPONSIVE_CSS
+        parts.append(RESPONSIVE_CSS)
     except Exception:
         pass
+    # Dedent each sheet separately: st.markdown only dedents the string as a whole
+    return "\n".join(textwrap.dedent(p).strip() for p in parts)
+
+
+def inject_css() -> None:
+    """Inject the shared Schlouh Analytics design system CSS with accessibility and responsive rules.
+
+    Streamlit drops elements a rerun does not re-emit, so this still runs every rerun;
+    it sends one cached <style> payload instead of three separately built ones.
+    """
+    st.markdown(_css_bundle(), unsafe_allow_html=True)